@@ -19,8 +19,10 @@ WITH chain_names AS (
 ),
 
 -- Token metadata for symbol lookups
+-- Addresses are lowercased ONCE here (staging already lowercases event addresses),
+-- so the joins below are plain equality instead of LOWER() on both sides per row
 token_metadata AS (
-    SELECT * FROM {{ ref('token_metadata') }}
+    {{ get_token_decimals_by_chain_id() }}
 ),
 
 -- Hourly token prices for USD conversion
@@ -235,12 +237,12 @@ LEFT JOIN chain_names dc ON m.destination_chain_id = dc.chain_id
 -- Join for deposit token symbol (origin chain token)
 LEFT JOIN token_metadata dt 
     ON m.origin_chain_id = dt.chain_id 
-    AND LOWER(m.deposit_token) = LOWER(dt.token_address)
+    AND m.deposit_token = dt.token_address
 
 -- Join for fill token symbol (destination chain token)
 LEFT JOIN token_metadata ft 
     ON m.destination_chain_id = ft.chain_id 
-    AND LOWER(m.fill_token) = LOWER(ft.token_address)
+    AND m.fill_token = ft.token_address
 
 -- Join for deposit token price at deposit hour (convert to UTC for matching)
 LEFT JOIN token_prices dp
@@ -264,11 +266,11 @@ LEFT JOIN token_prices np
 
 
 -- Exclude tokens without price data (POOL on Ethereum, POL on Polygon) if test_token_price_coverage fails
-WHERE LOWER(m.deposit_token) NOT IN (
+WHERE m.deposit_token NOT IN (
     '0x25788a1a171ec66da6502f9975a15b609ff54cf6',  -- POL on Polygon
-    '0x0cec1a9154ff802e7934fc916ed7ca50bde6844e'   -- POOL on Ethereum
+    '0x0cec1a9154ff802e7934fc916ed7ca50bde6844e',  -- POOL on Ethereum
     '0xd652c5425aea2afd5fb142e120fecf79e18fafc3',  -- POOL on Base
     '0xcf934e2402a5e072928a39a956964eb8f2b5b79c',  -- POOL on Arbitrum
     '0x4e107a0000db66f0e9fd2039288bf811dd1f9c74',  -- VELORA on Base
-    '0x395ae52bb17aef68c2888d941736a71dc6d4e125',  -- POOL on Optimism
+    '0x395ae52bb17aef68c2888d941736a71dc6d4e125'   -- POOL on Optimism
 )
\ No newline at end of file
@@ -4,6 +4,10 @@
 
 {{ config(materialized='view') }}
 
+-- Supported chain IDs (chains we have parquet data for)
+-- 42161=Arbitrum, 1=Ethereum, 137=Polygon, 59144=Linea, 480=Worldchain, 130=Unichain, 999=HyperEVM, 143=Monad, 8453=Base, 56=BSC, 10=Optimism
+{% set supported_chain_ids = [42161, 1, 137, 59144, 480, 130, 999, 143, 8453, 56, 10] %}
+
 -- Each CTE selects from a chain's staging model and adds the origin chain ID
 WITH arbitrum_deposits AS (
     SELECT 
@@ -203,9 +207,6 @@ optimism_deposits AS (
     FROM {{ ref('stg_optimism__deposits') }}
 ),
 
--- Supported chain IDs (chains we have parquet data for)
--- 42161=Arbitrum, 1=Ethereum, 137=Polygon, 59144=Linea, 480=Worldchain, 130=Unichain, 999=HyperEVM, 143=Monad, 8453=Base, 56=BSC, 10=Optimism
-
 -- Chain ID to Name mapping (from centralized seed)
 chain_names AS (
     SELECT chain_id, chain_name
@@ -225,27 +226,31 @@ token_prices AS (
 -- UNION ALL: Stack all deposits from all chains into one table
 -- Filter: Only include deposits where destination_chain_id is a supported chain
 all_deposits AS (
-    SELECT * FROM arbitrum_deposits WHERE destination_chain_id IN (42161, 1, 137, 59144, 480, 130, 999, 143, 8453, 56, 10)
-    UNION ALL
-    SELECT * FROM ethereum_deposits WHERE destination_chain_id IN (42161, 1, 137, 59144, 480, 130, 999, 143, 8453, 56, 10)
-    UNION ALL
-    SELECT * FROM polygon_deposits WHERE destination_chain_id IN (42161, 1, 137, 59144, 480, 130, 999, 143, 8453, 56, 10)
-    UNION ALL
-    SELECT * FROM linea_deposits WHERE destination_chain_id IN (42161, 1, 137, 59144, 480, 130, 999, 143, 8453, 56, 10)
-    UNION ALL
-    SELECT * FROM worldchain_deposits WHERE destination_chain_id IN (42161, 1, 137, 59144, 480, 130, 999, 143, 8453, 56, 10)
-    UNION ALL
-    SELECT * FROM unichain_deposits WHERE destination_chain_id IN (42161, 1, 137, 59144, 480, 130, 999, 143, 8453, 56, 10)
-    UNION ALL
-    SELECT * FROM hyperevm_deposits WHERE destination_chain_id IN (42161, 1, 137, 59144, 480, 130, 999, 143, 8453, 56, 10)
-    UNION ALL
-    SELECT * FROM monad_deposits WHERE destination_chain_id IN (42161, 1, 137, 59144, 480, 130, 999, 143, 8453, 56, 10)
-    UNION ALL
-    SELECT * FROM base_deposits WHERE destination_chain_id IN (42161, 1, 137, 59144, 480, 130, 999, 143, 8453, 56, 10)
-    UNION ALL
-    SELECT * FROM bsc_deposits WHERE destination_chain_id IN (42161, 1, 137, 59144, 480, 130, 999, 143, 8453, 56, 10)
-    UNION ALL
-    SELECT * FROM optimism_deposits WHERE destination_chain_id IN (42161, 1, 137, 59144, 480, 130, 999, 143, 8453, 56, 10)
+    SELECT * FROM (
+        SELECT * FROM arbitrum_deposits
+        UNION ALL
+        SELECT * FROM ethereum_deposits
+        UNION ALL
+        SELECT * FROM polygon_deposits
+        UNION ALL
+        SELECT * FROM linea_deposits
+        UNION ALL
+        SELECT * FROM worldchain_deposits
+        UNION ALL
+        SELECT * FROM unichain_deposits
+        UNION ALL
+        SELECT * FROM hyperevm_deposits
+        UNION ALL
+        SELECT * FROM monad_deposits
+        UNION ALL
+        SELECT * FROM base_deposits
+        UNION ALL
+        SELECT * FROM bsc_deposits
+        UNION ALL
+        SELECT * FROM optimism_deposits
+    ) unioned
+    -- Single filter over the stacked rows (chain list kept in one place above)
+    WHERE destination_chain_id IN ({{ supported_chain_ids | join(', ') }})
 )
 
 -- Final SELECT with descriptive chain names and USD amounts
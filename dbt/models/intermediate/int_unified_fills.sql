@@ -4,6 +4,10 @@
 
 {{ config(materialized='view') }}
 
+-- Supported chain IDs (chains we have parquet data for)
+-- 42161=Arbitrum, 1=Ethereum, 137=Polygon, 59144=Linea, 480=Worldchain, 130=Unichain, 999=HyperEVM, 143=Monad, 8453=Base, 56=BSC, 10=Optimism
+{% set supported_chain_ids = [42161, 1, 137, 59144, 480, 130, 999, 143, 8453, 56, 10] %}
+
 -- Each CTE selects from a chain's staging model and adds the destination chain ID
 WITH arbitrum_fills AS (
     SELECT 
@@ -247,9 +251,6 @@ optimism_fills AS (
     FROM {{ ref('stg_optimism__fills') }}
 ),
 
--- Supported chain IDs (chains we have parquet data for)
--- 42161=Arbitrum, 1=Ethereum, 137=Polygon, 59144=Linea, 480=Worldchain, 130=Unichain, 999=HyperEVM, 143=Monad, 8453=Base, 56=BSC, 10=Optimism
-
 -- Chain ID to Name mapping (from centralized seed)
 chain_names AS (
     SELECT chain_id, chain_name
@@ -269,27 +270,31 @@ token_prices AS (
 -- UNION ALL: Stack all fills from all chains into one table
 -- Filter: Only include fills where origin_chain_id is a supported chain
 all_fills AS (
-    SELECT * FROM arbitrum_fills WHERE origin_chain_id IN (42161, 1, 137, 59144, 480, 130, 999, 143, 8453, 56, 10)
-    UNION ALL
-    SELECT * FROM ethereum_fills WHERE origin_chain_id IN (42161, 1, 137, 59144, 480, 130, 999, 143, 8453, 56, 10)
-    UNION ALL
-    SELECT * FROM polygon_fills WHERE origin_chain_id IN (42161, 1, 137, 59144, 480, 130, 999, 143, 8453, 56, 10)
-    UNION ALL
-    SELECT * FROM linea_fills WHERE origin_chain_id IN (42161, 1, 137, 59144, 480, 130, 999, 143, 8453, 56, 10)
-    UNION ALL
-    SELECT * FROM worldchain_fills WHERE origin_chain_id IN (42161, 1, 137, 59144, 480, 130, 999, 143, 8453, 56, 10)
-    UNION ALL
-    SELECT * FROM unichain_fills WHERE origin_chain_id IN (42161, 1, 137, 59144, 480, 130, 999, 143, 8453, 56, 10)
-    UNION ALL
-    SELECT * FROM hyperevm_fills WHERE origin_chain_id IN (42161, 1, 137, 59144, 480, 130, 999, 143, 8453, 56, 10)
-    UNION ALL
-    SELECT * FROM monad_fills WHERE origin_chain_id IN (42161, 1, 137, 59144, 480, 130, 999, 143, 8453, 56, 10)
-    UNION ALL
-    SELECT * FROM base_fills WHERE origin_chain_id IN (42161, 1, 137, 59144, 480, 130, 999, 143, 8453, 56, 10)
-    UNION ALL
-    SELECT * FROM bsc_fills WHERE origin_chain_id IN (42161, 1, 137, 59144, 480, 130, 999, 143, 8453, 56, 10)
-    UNION ALL
-    SELECT * FROM optimism_fills WHERE origin_chain_id IN (42161, 1, 137, 59144, 480, 130, 999, 143, 8453, 56, 10)
+    SELECT * FROM (
+        SELECT * FROM arbitrum_fills
+        UNION ALL
+        SELECT * FROM ethereum_fills
+        UNION ALL
+        SELECT * FROM polygon_fills
+        UNION ALL
+        SELECT * FROM linea_fills
+        UNION ALL
+        SELECT * FROM worldchain_fills
+        UNION ALL
+        SELECT * FROM unichain_fills
+        UNION ALL
+        SELECT * FROM hyperevm_fills
+        UNION ALL
+        SELECT * FROM monad_fills
+        UNION ALL
+        SELECT * FROM base_fills
+        UNION ALL
+        SELECT * FROM bsc_fills
+        UNION ALL
+        SELECT * FROM optimism_fills
+    ) unioned
+    -- Single filter over the stacked rows (chain list kept in one place above)
+    WHERE origin_chain_id IN ({{ supported_chain_ids | join(', ') }})
 )
 
 -- Final SELECT with descriptive chain names and USD amounts
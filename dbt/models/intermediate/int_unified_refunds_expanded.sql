@@ -24,8 +24,10 @@ token_prices AS (
 ),
 
 -- Unnest the comma-separated strings into individual rows
--- Uses CROSS JOIN LATERAL with UNNEST to expand arrays
--- WITH ORDINALITY gives us the position index for matching amounts to addresses
+-- Multi-argument UNNEST zips both arrays in ONE pass: the i-th amount lands on
+-- the same row as the i-th address (O(n) rows per batch, instead of
+-- expanding each array separately and filtering the n×n cross product)
+-- WITH ORDINALITY gives us the position index (refund_index)
 expanded AS (
     SELECT
         -- Batch-level identifiers (same for all rows from same batch)
@@ -45,21 +47,20 @@ expanded AS (
         
         -- Individual refund data (one row per relayer/amount pair)
         -- TRIM handles any whitespace that might exist in the CSV-like strings
-        TRIM(amounts.amount)::NUMERIC AS refund_amount_raw,
-        TRIM(addresses.address) AS relayer_address,
-        amounts.idx AS refund_index
+        TRIM(refunds.amount)::NUMERIC AS refund_amount_raw,
+        TRIM(refunds.address) AS relayer_address,
+        refunds.idx AS refund_index
         
     FROM unified
-    -- Expand refund_amounts_string: "100,200,300" → 3 rows with values 100, 200, 300
-    CROSS JOIN LATERAL UNNEST(
-        string_to_array(refund_amounts_string, ',')
-    ) WITH ORDINALITY AS amounts(amount, idx)
-    -- Expand refund_addresses_string: "0xAAA,0xBBB,0xCCC" → 3 rows with addresses
+    -- "100,200,300" + "0xAAA,0xBBB,0xCCC" → (100, 0xAAA, 1), (200, 0xBBB, 2), (300, 0xCCC, 3)
     CROSS JOIN LATERAL UNNEST(
+        string_to_array(refund_amounts_string, ','),
         string_to_array(refund_addresses_string, ',')
-    ) WITH ORDINALITY AS addresses(address, idx)
-    -- Match by position: 1st amount goes to 1st address, 2nd to 2nd, etc.
-    WHERE amounts.idx = addresses.idx
+    ) WITH ORDINALITY AS refunds(amount, address, idx)
+    -- UNNEST pads the shorter array with NULLs; keep only complete pairs
+    -- (same rows as matching positions of both arrays)
+    WHERE refunds.amount IS NOT NULL
+      AND refunds.address IS NOT NULL
 )
 
 SELECT
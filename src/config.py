@@ -38,6 +38,9 @@ ETL_CONFIG = {
     "max_retries": 3,
     "timeout": 30,
     
+    # Alchemy settings
+    "alchemy_receipt_concurrency": 1,   # receipt batches in flight; >1 only on paid tiers (free tier rate-limits)
+    
     # API URLs
     "etherscan_url": "https://api.etherscan.io/v2/api",
     "moralis_url": "https://deep-index.moralis.io/api/v2.2",
@@ -11,6 +11,7 @@ import sys
 import time
 import json
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from dotenv import load_dotenv
 from requests.adapters import HTTPAdapter
@@ -37,9 +38,17 @@ with open(os.path.join(PROJECT_ROOT, "data", "seeds", "tokens_contracts_per_chai
 # Alchemy free tier limit - MUST be 10 for free tier!
 BLOCKS_PER_REQUEST = 10
 
+# eth_getLogs windows sent per JSON-RPC batch call (one HTTP round-trip)
+LOG_REQUESTS_PER_BATCH = 10
+
 # Receipt batch size (Alchemy supports up to 100)
 RECEIPT_BATCH_SIZE = 50
 
+# Receipt batches in flight at once. Defaults to 1 (sequential): the free tier
+# rate-limits concurrent batches, and a batch that runs out of retries is saved
+# without gas data. Raise it in ETL_CONFIG on paid tiers (max 10 = pool size).
+RECEIPT_CONCURRENT_BATCHES = min(max(1, ETL_CONFIG.get("alchemy_receipt_concurrency", 1)), 10)
+
 # Save interval in seconds (5 minutes)
 SAVE_INTERVAL_SECONDS = 60
 
@@ -57,6 +66,9 @@ OUTPUT_FILE = None
 def create_session() -> requests.Session:
     """Create a requests session with retry logic and connection pooling."""
     session = requests.Session()
+    # urllib3 does not retry POSTs on HTTP status (POST is not in its default
+    # allowed_methods), so 429/5xx on JSON-RPC calls reach the fetch_* loops,
+    # which own the back-off - one retry layer, no compounding attempts
     retry_strategy = Retry(
         total=3,
         backoff_factor=0.5,
@@ -87,22 +99,46 @@ def get_current_block() -> int | None:
     return int(result["result"], 16) if "result" in result else None
 
 
-def fetch_logs_batch(from_block: int, to_block: int) -> dict:
-    """Fetch logs for a single batch (max 10 blocks on free tier)."""
-    payload = {
-        "jsonrpc": "2.0",
-        "method": "eth_getLogs",
-        "params": [{
-            "fromBlock": hex(from_block),
-            "toBlock": hex(to_block),
-            "address": SPOKEPOOL_ADDRESS,
-            "topics": [EVENT_TOPICS]
-        }],
-        "id": 1
-    }
+def fetch_logs_batches(block_ranges: list) -> list:
+    """
+    Fetch logs for several block windows in a single JSON-RPC batch call.
+    
+    Each window is still its own eth_getLogs request (max 10 blocks on free
+    tier), but they share one HTTP round-trip. Returns one response dict per
+    window, in the same order as block_ranges.
+    """
+    payload = [
+        {
+            "jsonrpc": "2.0",
+            "id": idx,
+            "method": "eth_getLogs",
+            "params": [{
+                "fromBlock": hex(from_block),
+                "toBlock": hex(to_block),
+                "address": SPOKEPOOL_ADDRESS,
+                "topics": [EVENT_TOPICS]
+            }]
+        }
+        for idx, (from_block, to_block) in enumerate(block_ranges)
+    ]
     
     response = SESSION.post(ACTIVE_RPC_URL, json=payload, timeout=30)
-    return response.json()
+    results = response.json()
+    
+    # A whole-batch failure (e.g. rate limit) comes back as a single object
+    if isinstance(results, dict):
+        return [results] * len(block_ranges)
+    
+    # Batch responses may arrive in any order - put them back by request id
+    by_id = {r.get("id"): r for r in results}
+    missing = {"error": "no response for this request in batch"}
+    return [by_id.get(idx, missing) for idx in range(len(block_ranges))]
+
+
+def rate_limit_wait(response: requests.Response, attempt: int) -> float:
+    """Seconds to wait after a 429: exponential back-off, or Retry-After if longer."""
+    retry_after = response.headers.get("Retry-After", "")
+    return max(2 ** attempt, float(retry_after) if retry_after.isdigit() else 0)
 
 
 def fetch_receipt_batch(tx_hashes: list, max_retries: int = 5) -> dict:
@@ -116,8 +152,9 @@ def fetch_receipt_batch(tx_hashes: list, max_retries: int = 5) -> dict:
         for idx, tx_hash in enumerate(tx_hashes)
     ]
     
-    # Map id back to tx_hash for tracking null results
-    id_to_hash = {idx: tx_hash for idx, tx_hash in enumerate(tx_hashes)}
+    # Request ids are dense positions 0..n-1, so tx_hashes itself maps id -> tx_hash
+    # (plain list index instead of building a separate dict per batch)
+    num_hashes = len(tx_hashes)
     
     for attempt in range(max_retries):
         try:
@@ -125,7 +162,7 @@ def fetch_receipt_batch(tx_hashes: list, max_retries: int = 5) -> dict:
             response = SESSION.post(GAS_RPC_URL, json=payload, timeout=30)
             
             if response.status_code == 429:
-                wait_time = 2 ** attempt
+                wait_time = rate_limit_wait(response, attempt)
                 print(f"  Rate limited (429). Waiting {wait_time}s before retry {attempt + 1}/{max_retries}...")
                 time.sleep(wait_time)
                 continue
@@ -152,9 +189,9 @@ def fetch_receipt_batch(tx_hashes: list, max_retries: int = 5) -> dict:
                         "gasPrice": receipt.get("gasPrice"),
                         "status": receipt.get("status"),
                     }
-                elif req_id is not None and req_id in id_to_hash:
+                elif isinstance(req_id, int) and 0 <= req_id < num_hashes:
                     # Track tx hashes that returned null
-                    null_hashes.append(id_to_hash[req_id])
+                    null_hashes.append(tx_hashes[req_id])
             
             # Retry null results individually after a delay (may be pending)
             if null_hashes:
@@ -191,7 +228,7 @@ def fetch_single_receipt(tx_hash: str, max_retries: int = 3) -> dict | None:
             response = SESSION.post(GAS_RPC_URL, json=payload, timeout=30)
             
             if response.status_code == 429:
-                time.sleep(2 ** attempt)
+                time.sleep(rate_limit_wait(response, attempt))
                 continue
             
             response.raise_for_status()
@@ -225,13 +262,16 @@ def fetch_all_receipts(logs: list) -> dict:
     all_receipts = {}
     total_batches = (len(tx_hashes) + RECEIPT_BATCH_SIZE - 1) // RECEIPT_BATCH_SIZE
     
-    for i in range(0, len(tx_hashes), RECEIPT_BATCH_SIZE):
-        batch_num = i // RECEIPT_BATCH_SIZE + 1
-        batch = tx_hashes[i:i + RECEIPT_BATCH_SIZE]
-        receipts = fetch_receipt_batch(batch)
-        all_receipts.update(receipts)
-        print(f"  Receipt batch {batch_num}/{total_batches} | Got {len(receipts)} receipts")
-        time.sleep(0.5)  # Rate limiting between batches
+    batches = [tx_hashes[i:i + RECEIPT_BATCH_SIZE] for i in range(0, len(tx_hashes), RECEIPT_BATCH_SIZE)]
+    
+    # Up to RECEIPT_CONCURRENT_BATCHES batches in flight (1 = sequential by
+    # default); executor.map() yields results in batch order, so progress lines
+    # read the same either way. No fixed pause between batches: 429s are backed
+    # off by fetch_receipt_batch
+    with ThreadPoolExecutor(max_workers=RECEIPT_CONCURRENT_BATCHES) as executor:
+        for batch_num, receipts in enumerate(executor.map(fetch_receipt_batch, batches), start=1):
+            all_receipts.update(receipts)
+            print(f"  Receipt batch {batch_num}/{total_batches} | Got {len(receipts)} receipts")
     
     print(f"✅ Fetched {len(all_receipts)} transaction receipts")
     return all_receipts
@@ -252,16 +292,17 @@ def enrich_logs_with_gas(logs: list, receipts: dict) -> list:
         # Remove 'removed' field to match Etherscan format
         log.pop("removed", None)
         
-        # Add gas data if available
-        if tx_hash in receipts:
-            log["gasUsed"] = receipts[tx_hash].get("gasUsed")
-            log["gasPrice"] = receipts[tx_hash].get("effectiveGasPrice") or receipts[tx_hash].get("gasPrice")
+        # Add gas data if available (receipt looked up ONCE per log)
+        receipt = receipts.get(tx_hash)
+        if receipt is not None:
+            log["gasUsed"] = receipt.get("gasUsed")
+            log["gasPrice"] = receipt.get("effectiveGasPrice") or receipt.get("gasPrice")
             enriched_count += 1
         
         if not log.get("gasPrice"):
             print(f"⚠️ Missing gas price for log: {tx_hash}")
-            if tx_hash in receipts:
-                print(f"   Receipt data: {receipts[tx_hash]}")
+            if receipt is not None:
+                print(f"   Receipt data: {receipt}")
             else:
                 print(f"   Receipt NOT found in batch fetch.")
 
@@ -271,13 +312,24 @@ def enrich_logs_with_gas(logs: list, receipts: dict) -> list:
     return enriched
 
 
-def save_logs_to_jsonl(logs: list, filepath: str) -> int:
-    """Save logs to JSONL file with deduplication."""
-    os.makedirs(os.path.dirname(filepath), exist_ok=True)
+# Dedup keys already written, per output file: filepath -> (file size after
+# our last write, keys). Checkpoints append to the same file every few
+# minutes; reusing the set avoids re-reading and re-parsing the whole file
+# each time. If the size no longer matches (file replaced or edited outside
+# this run), the keys are reloaded from disk.
+_SAVED_LOG_KEYS = {}
+
+
+def _load_saved_log_keys(filepath: str) -> set:
+    """Return the tx-logIndex keys already in filepath (memoized per run)."""
+    file_size = os.path.getsize(filepath) if os.path.exists(filepath) else 0
+    cached = _SAVED_LOG_KEYS.get(filepath)
+    if cached is not None and cached[0] == file_size:
+        return cached[1]
     
     # Load existing logs for deduplication
     existing_keys = set()
-    if os.path.exists(filepath):
+    if file_size:
         try:
             with open(filepath, 'r') as f:
                 for line in f:
@@ -287,17 +339,28 @@ def save_logs_to_jsonl(logs: list, filepath: str) -> int:
                         existing_keys.add(key)
         except (json.JSONDecodeError, FileNotFoundError):
             pass
+    return existing_keys
+
+
+def save_logs_to_jsonl(logs: list, filepath: str) -> int:
+    """Save logs to JSONL file with deduplication."""
+    os.makedirs(os.path.dirname(filepath), exist_ok=True)
+    
+    existing_keys = _load_saved_log_keys(filepath)
+    
+    # Add new logs (deduplicated), buffered and written in a single call
+    new_lines = []
+    for log in logs:
+        key = f"{log.get('transactionHash', '')}-{log.get('logIndex', '')}"
+        if key not in existing_keys:
+            existing_keys.add(key)
+            new_lines.append(json.dumps(log))
     
-    # Add new logs (deduplicated)
-    new_count = 0
     with open(filepath, 'a') as f:
-        for log in logs:
-            key = f"{log.get('transactionHash', '')}-{log.get('logIndex', '')}"
-            if key not in existing_keys:
-                existing_keys.add(key)
-                f.write(json.dumps(log) + '\n')
-                new_count += 1
+        if new_lines:
+            f.write('\n'.join(new_lines) + '\n')
     
+    _SAVED_LOG_KEYS[filepath] = (os.path.getsize(filepath), existing_keys)
     return len(existing_keys)
 
 
@@ -333,8 +396,8 @@ def extract_and_enrich(from_block: int, to_block: int):
     total_blocks = to_block - from_block
     total_batches = (total_blocks + BLOCKS_PER_REQUEST - 1) // BLOCKS_PER_REQUEST
     print(f"✓ Total blocks: {total_blocks:,}")
-    print(f"✓ Total batches: {total_batches:,} ({BLOCKS_PER_REQUEST} blocks each)")
-    print(f"✓ Estimated time: ~{total_batches * 0.15 / 60:.1f} minutes")
+    print(f"✓ Total batches: {total_batches:,} ({BLOCKS_PER_REQUEST} blocks each, {LOG_REQUESTS_PER_BATCH} per request)")
+    print(f"✓ Estimated time: ~{total_batches / LOG_REQUESTS_PER_BATCH * 0.15 / 60:.1f} minutes")
     print(f"✓ Auto-save every: {SAVE_INTERVAL_SECONDS // 60} minutes")
     print(f"✓ Output file: {OUTPUT_FILE}")
     
@@ -355,32 +418,41 @@ def extract_and_enrich(from_block: int, to_block: int):
     
     try:
         while current < to_block:
-            batch_end = min(current + BLOCKS_PER_REQUEST - 1, to_block)
-            
-            result = fetch_logs_batch(current, batch_end)
+            # Next windows of BLOCKS_PER_REQUEST blocks, fetched in one batch call
+            block_ranges = []
+            window_start = current
+            while window_start < to_block and len(block_ranges) < LOG_REQUESTS_PER_BATCH:
+                window_end = min(window_start + BLOCKS_PER_REQUEST - 1, to_block)
+                block_ranges.append((window_start, window_end))
+                window_start = window_end + 1
             
-            if "error" in result:
-                print(f"\n❌ API Error at batch {batch_count}: {result['error']}")
-                print(f"   Retrying in 2 seconds...")
-                time.sleep(2)
-                continue
+            results = fetch_logs_batches(block_ranges)
             
-            logs_in_batch = 0
-            if "result" in result:
-                logs = result["result"]
-                all_logs.extend(logs)
-                logs_in_batch = len(logs)
+            # Windows are processed in order; on the first error we stop and
+            # retry from that window, so no block range is skipped
+            for (batch_start, batch_end), result in zip(block_ranges, results):
+                if "error" in result:
+                    print(f"\n❌ API Error at batch {batch_count}: {result['error']}")
+                    print(f"   Retrying in 2 seconds...")
+                    time.sleep(2)
+                    break
                 
-                if logs_in_batch > 0:
-                    first_log_timestamp = int(logs[0].get('blockTimestamp', '0x0'), 16)
-                    last_timestamp = datetime.fromtimestamp(first_log_timestamp)
-            
-            batch_count += 1
-            
-            print_batch_progress(batch_count, total_batches, current, batch_end, 
-                               logs_in_batch, len(all_logs), start_time, last_timestamp)
-            
-            current = batch_end + 1
+                logs_in_batch = 0
+                if "result" in result:
+                    logs = result["result"]
+                    all_logs.extend(logs)
+                    logs_in_batch = len(logs)
+                    
+                    if logs_in_batch > 0:
+                        first_log_timestamp = int(logs[0].get('blockTimestamp', '0x0'), 16)
+                        last_timestamp = datetime.fromtimestamp(first_log_timestamp)
+                
+                batch_count += 1
+                
+                print_batch_progress(batch_count, total_batches, batch_start, batch_end, 
+                                   logs_in_batch, len(all_logs), start_time, last_timestamp)
+                
+                current = batch_end + 1
             
             # Save checkpoint every 5 minutes
             if time.time() - last_save_time >= SAVE_INTERVAL_SECONDS:
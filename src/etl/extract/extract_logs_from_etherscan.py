@@ -7,6 +7,7 @@ Output Format: JSONL (JSON Lines) - one JSON object per line for memory efficien
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import time
 import os
@@ -27,6 +28,19 @@ from extract_utils import save_logs_to_jsonl, get_chain_params, date_to_timestam
 
 
 
+# =============================================================================
+# HTTP SESSION
+# =============================================================================
+
+# Persistent session: keeps the TCP+TLS connection to the Etherscan API alive
+# across the hundreds of sequential paginated calls instead of opening a new
+# connection (DNS + handshakes) per request.
+# Retries stay in api_call() so the retry/back-off behaviour is unchanged.
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=1))
+SESSION.headers.update({"Accept": "application/json"})
+
+
 # =============================================================================
 # CORE FUNCTIONS
 # =============================================================================
@@ -51,7 +65,7 @@ def api_call(params):
 
             # print(f"\nAPI call attempt {attempt + 1}/3") # for debugging
             # Make API request with 30 second timeout
-            response = requests.get(API_URL, params=params, timeout=30)
+            response = SESSION.get(API_URL, params=params, timeout=30)
             result = response.json()
             
             # Check if API returned success status
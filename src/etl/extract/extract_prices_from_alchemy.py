@@ -17,12 +17,15 @@ Airflow:
 import os
 import sys
 import time
+import shutil
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
 import requests
 import pandas as pd
+from requests.adapters import HTTPAdapter
 
 # Add src to path for config import
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
@@ -37,9 +40,21 @@ ALCHEMY_API_KEY = API_KEYS.get("alchemy") or os.getenv("ALCHEMY_API_KEY")
 BASE_URL = f"https://api.g.alchemy.com/prices/v1/{ALCHEMY_API_KEY}/tokens/historical"
 
 # Rate limiting
-RATE_LIMIT_DELAY = 0.2  # 200ms between requests
+RATE_LIMIT_DELAY = 0.2  # 200ms between requests (per worker)
 MAX_RETRIES = 3
 
+# Concurrent symbol fetches - requests are network-bound, so a small thread
+# pool overlaps round-trips; kept low to stay polite with the API rate limits
+MAX_CONCURRENT_REQUESTS = 5
+
+# Shared HTTP session: keep-alive reuses the TLS connection to the Prices API
+# across symbols instead of a new handshake per requests.post(). The pool is
+# sized to the thread pool so every worker can hold its own connection.
+# (Retries stay in fetch_price_history_by_symbol's own back-off loop.)
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=MAX_CONCURRENT_REQUESTS))
+SESSION.headers.update({"Content-Type": "application/json"})
+
 # Tokens to fetch - from config.py
 TOKENS_TO_FETCH = TOKENS_PRICES["tokens_to_fetch"]
 
@@ -82,14 +97,22 @@ def fetch_price_history_by_symbol(
         "interval": interval
     }
     
-    headers = {"Content-Type": "application/json"}
-    
     for attempt in range(MAX_RETRIES):
         try:
-            response = requests.post(BASE_URL, json=payload, headers=headers, timeout=30)
+            response = SESSION.post(BASE_URL, json=payload, timeout=30)
             
             if response.status_code == 429:
-                wait_time = RATE_LIMIT_DELAY * (2 ** attempt)
+                if attempt == MAX_RETRIES - 1:
+                    # Out of retries: raise HTTPError (429), so the caller reports
+                    # an error instead of mistaking the token for NOT FOUND
+                    response.raise_for_status()
+                # Up to MAX_CONCURRENT_REQUESTS workers share the rate limit, so
+                # the back-off is scaled by the pool size (1s, 2s, ... with 5
+                # workers); the server's Retry-After wins if it asks for longer
+                wait_time = RATE_LIMIT_DELAY * MAX_CONCURRENT_REQUESTS * (2 ** attempt)
+                retry_after = response.headers.get("Retry-After", "")
+                if retry_after.isdigit():
+                    wait_time = max(wait_time, float(retry_after))
                 print(f"Rate limited, waiting {wait_time:.1f}s...", end=" ")
                 time.sleep(wait_time)
                 continue
@@ -157,37 +180,58 @@ def extract_all_prices(
     print(f"API Key: {ALCHEMY_API_KEY[:8]}...{ALCHEMY_API_KEY[-4:]}")
     print()
     
-    all_prices = []
+    def fetch_symbol(symbol: str):
+        """Fetch one symbol; returns (prices, error) so the caller can report in order."""
+        try:
+            return fetch_price_history_by_symbol(symbol, start_time, end_time, interval), None
+        except Exception as e:
+            return None, e
+        finally:
+            time.sleep(RATE_LIMIT_DELAY)
+    
+    # Collected column-wise (one list per output column) so the DataFrame is
+    # built directly from columns, without a dict per price point
+    symbols, timestamps, prices_usd = [], [], []
+    failed_symbols = []
     
-    for symbol in tokens:
+    # Fetch all symbols concurrently (bounded pool); executor.map() returns
+    # results in token order, so the log output and row order are unchanged
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+        results = executor.map(fetch_symbol, tokens)
+    
+    for symbol, (prices, error) in zip(tokens, results):
         print(f"[FETCH] {symbol}...", end=" ")
         
-        try:
-            prices = fetch_price_history_by_symbol(symbol, start_time, end_time, interval)
-            
-            if not prices:
-                print("✗ NOT FOUND")
-                continue
-            
-            for p in prices:
-                p["token_symbol"] = symbol
-            
-            all_prices.extend(prices)
-            print(f"✓ {len(prices)} data points")
-            
-        except Exception as e:
-            print(f"✗ ERROR: {e}")
+        if error is not None:
+            print(f"✗ ERROR: {error}")
+            failed_symbols.append(symbol)
+            continue
         
-        time.sleep(RATE_LIMIT_DELAY)
+        if not prices:
+            print("✗ NOT FOUND")
+            continue
+        
+        symbols.extend([symbol] * len(prices))
+        timestamps.extend(p["timestamp"] for p in prices)
+        prices_usd.extend(p["price_usd"] for p in prices)
+        print(f"✓ {len(prices)} data points")
+    
+    if failed_symbols:
+        # Errors (e.g. rate limit retries used up) are not "no data" - these
+        # tokens have no prices in this run's output; rerun to fill them in
+        print(f"\n⚠ {len(failed_symbols)} token(s) failed and are missing from the output: {failed_symbols}")
     
-    # Build DataFrame
-    df = pd.DataFrame(all_prices)
+    # Build DataFrame (columns already in output order)
+    df = pd.DataFrame({
+        "token_symbol": symbols,
+        "timestamp": timestamps,
+        "price_usd": prices_usd,
+    })
     
     if df.empty:
         print("\n⚠ No price data collected!")
         return df
     
-    df = df[["token_symbol", "timestamp", "price_usd"]]
     df = df.sort_values(["token_symbol", "timestamp"])
     
     # Save to CSV
@@ -199,10 +243,12 @@ def extract_all_prices(
     df.to_csv(csv_file, index=False)
     
     # Also save to dbt/seeds/token_prices.csv for dbt seeds
+    # Stays CSV (dbt seeds and validate_prices_csv read CSV); the content is
+    # identical, so copy the bytes instead of formatting the DataFrame twice
     seeds_dir = PATHS["project_root"] / "dbt" / "seeds"
     seeds_dir.mkdir(parents=True, exist_ok=True)
     seeds_file = seeds_dir / "token_prices.csv"
-    df.to_csv(seeds_file, index=False)
+    shutil.copyfile(csv_file, seeds_file)
     
     print(f"\n{'='*60}")
     print(f"✅ Saved {len(df)} price records to:")
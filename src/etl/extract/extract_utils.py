@@ -6,13 +6,14 @@ import json
 import os
 import requests
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Dict, Any
 
 # Import config for API URLs
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-from config import ETL_CONFIG
+from config import ETL_CONFIG, PATHS
 
 
 def save_logs_to_jsonl(logs: list, output_file: str) -> int:
@@ -30,9 +31,12 @@ def save_logs_to_jsonl(logs: list, output_file: str) -> int:
     --------
     int: Number of logs written in this call
     """
+    # Serialize the whole batch first, then hand it to the file in one write
+    # (no per-line write call / string concatenation)
+    lines = [json.dumps(log) for log in logs]
     with open(output_file, "a", encoding="utf-8") as f:
-        for log in logs:
-            f.write(json.dumps(log) + "\n")
+        if lines:
+            f.write("\n".join(lines) + "\n")
     
     return len(logs)
 
@@ -56,6 +60,19 @@ def date_to_timestamp(date_str: str) -> int:
     return int(dt.timestamp())
 
 
+@lru_cache(maxsize=None)
+def _load_chains_config(json_path: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Load the chains configuration once per path, keyed by lowercase chain name.
+    
+    The config is static for the lifetime of a run, so every extractor call
+    after the first is a dict lookup instead of re-reading the JSON file.
+    """
+    with open(json_path, 'r', encoding='utf-8') as file:
+        chains_data = json.load(file)
+    return {name.lower(): params for name, params in chains_data.items()}
+
+
 def get_chain_params(chain_name: str, json_path: Path = None) -> Optional[Dict[str, Any]]:
     """
     Retrieve all parameters for a specific blockchain chain from the tokens configuration file.
@@ -71,16 +88,18 @@ def get_chain_params(chain_name: str, json_path: Path = None) -> Optional[Dict[s
     --------
     Dict or None: Chain configuration dict, or None if chain not found
     """
-    # Default path: project_root/dbt/seeds/tokens_contracts_per_chain.json
+    # Default path: project_root/data/seeds/tokens_contracts_per_chain.json
     if json_path is None:
-        project_root = Path(__file__).parent.parent.parent.parent
-        json_path = project_root / "dbt" / "seeds" / "tokens_contracts_per_chain.json"
+        json_path = PATHS["chain_config"]
     
-    with open(json_path, 'r', encoding='utf-8') as file:
-        chains_data = json.load(file)
-    
-    chain_name_lower = chain_name.lower()
-    return chains_data.get(chain_name_lower)
+    return _load_chains_config(str(json_path)).get(chain_name.lower())
+
+
+# Memo of successful Moralis lookups: (chain, date, url) -> block number.
+# Block-at-date never changes, and consecutive runs share boundaries
+# (end_date of one window = start_date of the next), so repeat calls are free.
+# Failures (None) are NOT cached so transient API errors can be retried.
+_BLOCK_FROM_DATE_CACHE: Dict[tuple, int] = {}
 
 
 def get_block_from_date(chain: str, date: str, moralis_url: str = None) -> int | None:
@@ -108,6 +127,10 @@ def get_block_from_date(chain: str, date: str, moralis_url: str = None) -> int |
     if moralis_url is None:
         moralis_url = ETL_CONFIG["moralis_url"]
     
+    cache_key = (chain, date, moralis_url)
+    if cache_key in _BLOCK_FROM_DATE_CACHE:
+        return _BLOCK_FROM_DATE_CACHE[cache_key]
+    
     date_encoded = f"{date}T00%3A00%3A00Z"
     url = f"{moralis_url}/dateToBlock?chain={chain}&date={date_encoded}"
     
@@ -121,7 +144,10 @@ def get_block_from_date(chain: str, date: str, moralis_url: str = None) -> int |
         
         if response.status_code == 200:
             result = response.json()
-            return result.get("block")
+            block = result.get("block")
+            if block is not None:
+                _BLOCK_FROM_DATE_CACHE[cache_key] = block
+            return block
         else:
             print(f"❌ Moralis API Error: {response.status_code} - {response.text}")
             return None
@@ -14,8 +14,11 @@ WHAT WE CHECK:
 - Basic type/format checks for critical fields
 """
 
-import json
 import csv
+import json
+import polars as pl
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
 from pathlib import Path
 from typing import Tuple, Optional, List, Dict, Any
 
@@ -66,8 +69,12 @@ def validate_logs_jsonl(file_path: Path) -> Tuple[bool, Optional[str], Optional[
             return False, "File is empty (0 bytes)", None, None
         
         # Check 3: Parse JSONL and validate each record
-        records = []
-        block_numbers = []
+        # Records are validated as they stream past and only counted - never
+        # kept in a list (the file can hold hundreds of thousands of logs)
+        record_count = 0
+        # Running block range instead of a list of every block number
+        min_block = None
+        max_block = None
         tx_hashes = set()
         seen_keys = set()
         duplicate_count = 0
@@ -132,16 +139,21 @@ def validate_logs_jsonl(file_path: Path) -> Tuple[bool, Optional[str], Optional[
                 else:
                     logs_without_gas += 1
                 
-                records.append(record)
+                record_count += 1
                 tx_hashes.add(tx_hash)
                 
                 try:
-                    block_numbers.append(int(record["blockNumber"], 16))
+                    block_number = int(record["blockNumber"], 16)
                 except (ValueError, TypeError):
                     pass
+                else:
+                    if min_block is None or block_number < min_block:
+                        min_block = block_number
+                    if max_block is None or block_number > max_block:
+                        max_block = block_number
         
         # Check 4: Not empty after parsing
-        if len(records) == 0:
+        if record_count == 0:
             return False, "File has no valid log records", None, None
         
         # Check 5: No duplicates
@@ -150,16 +162,16 @@ def validate_logs_jsonl(file_path: Path) -> Tuple[bool, Optional[str], Optional[
         
         # Build metadata
         metadata = {
-            "min_block": min(block_numbers) if block_numbers else None,
-            "max_block": max(block_numbers) if block_numbers else None,
+            "min_block": min_block,
+            "max_block": max_block,
             "unique_transactions": len(tx_hashes),
             "file_size_bytes": file_size,
             "logs_with_gas": logs_with_gas,
             "logs_without_gas": logs_without_gas,
-            "gas_coverage": f"{logs_with_gas}/{len(records)}" if records else "0/0"
+            "gas_coverage": f"{logs_with_gas}/{record_count}"
         }
         
-        return True, None, len(records), metadata
+        return True, None, record_count, metadata
         
     except Exception as e:
         return False, f"Validation error: {str(e)}", None, None
@@ -197,8 +209,57 @@ def validate_prices_csv(file_path: Path) -> Tuple[bool, Optional[str], Optional[
         if file_size == 0:
             return False, "File is empty (0 bytes)", None, None
         
+        # ─────────────────────────────────────────────────────────────────────
+        # Fast path: one vectorized read + one numeric pass over all rows
+        # ─────────────────────────────────────────────────────────────────────
+        # It can only ACCEPT a file. Anything it would not accept exactly like
+        # csv.DictReader does - a flagged row, a missing column, no rows, a
+        # header Polars reads differently (BOM stripped, duplicates renamed),
+        # a parse error - goes through _validate_prices_rows(), the reference
+        # row-by-row check, which builds the exact error message.
+        try:
+            with open(file_path, 'r', encoding='utf-8', newline='') as f:
+                header = next(csv.reader(f), None)
+            # All columns as strings; "" stays "" so empty fields are flagged
+            df = pl.read_csv(file_path, infer_schema=False, empty_string_is_null=False, truncate_ragged_lines=True)
+        except Exception:
+            return _validate_prices_rows(file_path, file_size, REQUIRED_COLUMNS)
+        
+        if (df.height == 0 or df.columns != header
+                or any(col not in df.columns for col in REQUIRED_COLUMNS)):
+            return _validate_prices_rows(file_path, file_size, REQUIRED_COLUMNS)
+        
+        # Flag rows that fail any check (empty token, non-numeric/negative
+        # price, short timestamp); blank lines come back as all-"" rows and are
+        # flagged too, so DictReader decides how to count them
+        token = pl.col("token_symbol").fill_null("").str.strip_chars()
+        price = pl.col("price_usd").fill_null("").str.strip_chars().cast(pl.Float64, strict=False)
+        timestamp = pl.col("timestamp").fill_null("").str.strip_chars()
+        has_flagged = df.select(
+            ((token == "") | price.is_null() | (price < 0) | (timestamp.str.len_chars() < 10)).any()
+        ).item()
+        if has_flagged:
+            return _validate_prices_rows(file_path, file_size, REQUIRED_COLUMNS)
+        
+        tokens_seen = set(df.select(token.unique()).to_series().to_list())
+        
+        metadata = {
+            "tokens": list(tokens_seen),
+            "token_count": len(tokens_seen),
+            "file_size_bytes": file_size
+        }
+        
+        return True, None, df.height, metadata
+        
+    except Exception as e:
+        return False, f"Validation error: {str(e)}", None, None
+
+
+def _validate_prices_rows(file_path: Path, file_size: int, required_columns: List[str]) -> Tuple[bool, Optional[str], Optional[int], Optional[Dict]]:
+    """Row-by-row price CSV validation with csv.DictReader (exact messages and row numbers)."""
+    try:
         # Check 3: Parse CSV
-        records = []
+        record_count = 0
         tokens_seen = set()
         
         with open(file_path, 'r', encoding='utf-8') as f:
@@ -208,7 +269,7 @@ def validate_prices_csv(file_path: Path) -> Tuple[bool, Optional[str], Optional[
             if reader.fieldnames is None:
                 return False, "CSV has no header row", None, None
             
-            missing_columns = [col for col in REQUIRED_COLUMNS if col not in reader.fieldnames]
+            missing_columns = [col for col in required_columns if col not in reader.fieldnames]
             if missing_columns:
                 return False, f"Missing required columns: {missing_columns}", None, None
             
@@ -232,11 +293,11 @@ def validate_prices_csv(file_path: Path) -> Tuple[bool, Optional[str], Optional[
                 if not timestamp or len(timestamp) < 10:
                     return False, f"Row {row_num}: Invalid timestamp: {timestamp}", None, None
                 
-                records.append(row)
+                record_count += 1
                 tokens_seen.add(token)
         
         # Check 5: Not empty
-        if len(records) == 0:
+        if record_count == 0:
             return False, "CSV has no data rows", None, None
         
         metadata = {
@@ -245,7 +306,7 @@ def validate_prices_csv(file_path: Path) -> Tuple[bool, Optional[str], Optional[
             "file_size_bytes": file_size
         }
         
-        return True, None, len(records), metadata
+        return True, None, record_count, metadata
         
     except Exception as e:
         return False, f"Validation error: {str(e)}", None, None
@@ -286,8 +347,8 @@ def validate_receipts_jsonl(file_path: Path) -> Tuple[bool, Optional[str], Optio
         if file_size == 0:
             return False, "File is empty (0 bytes)", None, None
         
-        # Check 3: Parse JSONL
-        records = []
+        # Check 3: Parse JSONL (records are counted, not kept in memory)
+        record_count = 0
         tx_hashes = set()
         
         with open(file_path, 'r', encoding='utf-8') as f:
@@ -326,16 +387,16 @@ def validate_receipts_jsonl(file_path: Path) -> Tuple[bool, Optional[str], Optio
                 if not gas_price.startswith("0x"):
                     return False, f"Line {line_num}: Invalid gasPrice format: {gas_price}", None, None
                 
-                records.append(record)
+                record_count += 1
                 tx_hashes.add(tx_hash)
         
         # Check 4: Not empty
-        if len(records) == 0:
+        if record_count == 0:
             return False, "File has no valid receipt records", None, None
         
         # Check 5: No duplicates
-        if len(tx_hashes) < len(records):
-            duplicate_count = len(records) - len(tx_hashes)
+        if len(tx_hashes) < record_count:
+            duplicate_count = record_count - len(tx_hashes)
             return False, f"Found {duplicate_count} duplicate receipts", None, None
         
         metadata = {
@@ -343,7 +404,7 @@ def validate_receipts_jsonl(file_path: Path) -> Tuple[bool, Optional[str], Optio
             "file_size_bytes": file_size
         }
         
-        return True, None, len(records), metadata
+        return True, None, record_count, metadata
         
     except Exception as e:
         return False, f"Validation error: {str(e)}", None, None
@@ -402,8 +463,16 @@ if __name__ == "__main__":
     else:
         valid_count = 0
         gas_issues_count = 0
-        for file_path in sorted(files):
-            is_valid, error, count, metadata = validate(file_path)
+        files = sorted(files)
+        
+        # Each file is validated independently with pure-Python JSON/CSV parsing
+        # (CPU-bound, GIL-limited) → fan out across processes.
+        # executor.map() yields results in input order, so output stays sorted.
+        # "spawn": workers run Polars (prices CSV), so don't fork its thread pool.
+        with ProcessPoolExecutor(mp_context=multiprocessing.get_context("spawn")) as executor:
+            results = executor.map(validate, files)
+        
+        for file_path, (is_valid, error, count, metadata) in zip(files, results):
             if is_valid:
                 # Check for gas coverage in JSONL log files
                 gas_info = ""
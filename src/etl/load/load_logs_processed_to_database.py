@@ -13,6 +13,9 @@ load_dotenv()
 # Project root directory (3 levels up from this script)
 PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
 
+# Rows per COPY round-trip (bounds the in-memory CSV buffer)
+COPY_CHUNK_ROWS = 100_000
+
 def get_db_connection(
     host: Optional[str] = None,
     port: Optional[str] = None,
@@ -117,9 +120,11 @@ def load_parquet_to_raw_copy(conn, parquet_path: str, table_name: str) -> int:
     """
     COPY-based file loader: stream Parquet -> CSV -> Postgres COPY STDIN
     """
-    # read parquet file into polars dataframe
-    df = pl.read_parquet(parquet_path)
-    if df.is_empty():
+    # Lazy scan: the file is read once, at collect() below, with the lineage
+    # columns and the target column layout applied in the same plan
+    lf = pl.scan_parquet(parquet_path)
+    # Row count comes from the Parquet footer (no column data decoded)
+    if lf.select(pl.len()).collect().item() == 0:
         print("No rows to load; Parquet is empty.")
         return 0
 
@@ -166,32 +171,44 @@ def load_parquet_to_raw_copy(conn, parquet_path: str, table_name: str) -> int:
         "source_file",
     ]
 
-    # Add blockchain, api_extracted_start_date, api_extracted_end_date columns with the values from the parquet file
-    df = df.with_columns(pl.lit(os.path.basename(parquet_path).split("_")[1]).alias("blockchain"))
-    df = df.with_columns(pl.lit(os.path.basename(parquet_path).split("_")[2].split(".")[0]).alias("api_extracted_start_date"))
-    df = df.with_columns(pl.lit(os.path.basename(parquet_path).split("_")[4].split(".")[0]).alias("api_extracted_end_date"))
-
-    # Add source_file column with the name of corresponding parquet file
-    df = df.with_columns(pl.lit(os.path.basename(parquet_path)).alias("source_file"))
+    # Parse lineage metadata from the filename ONCE
+    # Filename format: logs_<chain>_<start_date>_to_<end_date>_processed.parquet
+    file_name = os.path.basename(parquet_path)
+    name_parts = file_name.split("_")
+
+    # Add blockchain, api_extracted_start_date, api_extracted_end_date and source_file
+    # columns in a single pass (one new frame instead of four)
+    lf = lf.with_columns(
+        pl.lit(name_parts[1]).alias("blockchain"),
+        pl.lit(name_parts[2].split(".")[0]).alias("api_extracted_start_date"),
+        pl.lit(name_parts[4].split(".")[0]).alias("api_extracted_end_date"),
+        pl.lit(file_name).alias("source_file"),
+    )
 
     # Ensure all columns exist; missing ones become NULL
-    for col in columns:
-        if col not in df.columns:
-            df = df.with_columns(pl.lit(None).alias(col))
-    df = df.select(columns)
-
-    # Stream DataFrame to CSV in-memory for COPY
-    buffer = StringIO()
-    df.write_csv(buffer, include_header=False)
-    buffer.seek(0)
+    # Build the target layout in ONE select (set lookup, no per-column frame copies)
+    # and materialize only then: no full intermediate frame before the reorder
+    present = set(lf.collect_schema().names())
+    df = lf.select([
+        pl.col(col) if col in present else pl.lit(None).alias(col)
+        for col in columns
+    ]).collect()
 
     copy_sql = f"""
         COPY raw.{table_name} ({", ".join(columns)})
         FROM STDIN WITH (FORMAT CSV)
     """
 
+    # Stream DataFrame to CSV in-memory for COPY, one slice at a time:
+    # only COPY_CHUNK_ROWS rows are ever held as CSV text (instead of a second,
+    # text-encoded copy of the whole file). All chunks share one transaction,
+    # so a failed chunk still rolls back the whole file.
     with conn.cursor() as cur:
-        cur.copy_expert(sql=copy_sql, file=buffer)
+        for chunk in df.iter_slices(n_rows=COPY_CHUNK_ROWS):
+            buffer = StringIO()
+            chunk.write_csv(buffer, include_header=False)
+            buffer.seek(0)
+            cur.copy_expert(sql=copy_sql, file=buffer)
     conn.commit()
 
     inserted = len(df)
@@ -2,7 +2,7 @@ import polars as pl
 import json
 from pathlib import Path
 from typing import Tuple, List, Optional
-from datetime import datetime
+from datetime import datetime, timezone
 
 # Project root directory (3 levels up from this script)
 PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
@@ -76,9 +76,9 @@ def validate(file_path: Path) -> Tuple[bool, Optional[str], Optional[datetime],
         if row_count == 0:
             return False, "File is empty (0 rows)", None, None, None
         
-        # Check 3b: Duplicates
-        if df.is_duplicated().any():
-             duplicate_count = df.is_duplicated().sum()
+        # Check 3b: Duplicates (computed once, reused for the message)
+        duplicate_count = df.is_duplicated().sum()
+        if duplicate_count:
              return False, f"Found {duplicate_count} duplicate rows", None, None, None
 
         # Check 4: Has required columns
@@ -86,115 +86,148 @@ def validate(file_path: Path) -> Tuple[bool, Optional[str], Optional[datetime],
         if missing_columns:
             return False, f"Missing required columns: {missing_columns}", None, None, None
         
+        # ─────────────────────────────────────────────────────────────────────
+        # Checks 5-11 in ONE vectorized sweep
+        # ─────────────────────────────────────────────────────────────────────
+        # All per-column aggregates are computed in a single select (Polars runs
+        # them in parallel over one scan) instead of one pass + temporary frame
+        # per check. The checks below then only compare scalars, in the original
+        # order and with the original error messages.
+        #
+        # Dtype-specific expressions (< 0, > now, .str.*) are only added for
+        # columns that already have the expected dtype - in a select they would
+        # raise on a wrong dtype before checks 7-9 get to report it. Columns
+        # with an unexpected dtype keep the per-Series path below.
+        amount_cols = [
+            "filled_relay_data_input_amount",
+            "filled_relay_data_output_amount",
+            "funds_deposited_data_input_amount",
+            "funds_deposited_data_output_amount",
+            "amount_to_return",
+        ]
+        # Note: refund_addresses is excluded as it is a CSV string of addresses
+        address_cols = [
+            "topic_relayer",
+            "filled_relay_data_input_token",
+            "filled_relay_data_output_token",
+            "filled_relay_data_exclusive_relayer",
+            "filled_relay_data_depositor",
+            "filled_relay_data_recipient",
+            "topic_depositor",
+            "funds_deposited_data_input_token",
+            "funds_deposited_data_output_token",
+            "funds_deposited_data_recipient",
+            "l2_token_address"
+        ]
+        address_cols = [col for col in address_cols if col in df.columns]
+        # String checks only apply to string columns (others fail the dtype check)
+        utf8_address_cols = [col for col in address_cols if df.schema[col] == pl.Utf8]
+        # Gas columns are not in REQUIRED_COLUMNS; a missing one must only fail
+        # at check 10, not make this select fail before checks 5-9
+        gas_cols = [col for col in ["gas_price_wei", "gas_used"] if col in df.columns]
+        numeric_neg_cols = [col for col in amount_cols + ["refund_count"] if df.schema[col].is_numeric()]
+        # Comparing against the naive current_time only works for a naive Datetime
+        ts_dtype = df.schema["timestamp_datetime"]
+        ts_is_naive = isinstance(ts_dtype, pl.Datetime) and ts_dtype.time_zone is None
+        
+        # Use timezone-naive datetime since parquet data is typically naive
+        current_time = datetime.now(timezone.utc).replace(tzinfo=None)
+        is_future = pl.col("timestamp_datetime").is_not_null() & (pl.col("timestamp_datetime") > current_time)
+        
+        def bad_format(col: str, length: int) -> pl.Expr:
+            return (
+                pl.col(col).is_not_null() &
+                (~pl.col(col).str.starts_with("0x") | (pl.col(col).str.len_chars() != length))
+            ).sum().alias(f"{col}__bad")
+        
+        hash_is_utf8 = df.schema["transactionHash"] == pl.Utf8
+        
+        stats = df.select(
+            # Check 5: Required identity fields
+            *[pl.col(col).null_count().alias(f"{col}__nulls")
+              for col in ["transactionHash", "timestamp_datetime", "topic_0"] + gas_cols],
+            # Check 6: Amounts non-negative (refund_count is Int64, nulls never count)
+            *[(pl.col(col) < 0).any().alias(f"{col}__neg") for col in numeric_neg_cols],
+            # Checks 7-9: "has any value" flags gating the dtype checks
+            *[pl.col(col).is_not_null().any().alias(f"{col}__any")
+              for col in amount_cols + ["refund_amounts", "refund_addresses", "refund_count", "timestamp_datetime"] + address_cols],
+            # Check 9: Strict Address & Hash format (startswith 0x, length 42 or 66)
+            *[bad_format(col, 42) for col in utf8_address_cols],
+            *([bad_format("transactionHash", 66)] if hash_is_utf8 else []),
+            # Check 11: Future timestamps + date range for the return value
+            *([
+                is_future.sum().alias("future__count"),
+                pl.col("timestamp_datetime").filter(is_future).max().alias("future__max"),
+                pl.col("timestamp_datetime").min().alias("ts__min"),
+                pl.col("timestamp_datetime").max().alias("ts__max"),
+            ] if ts_is_naive else []),
+        ).row(0, named=True)
+        
         # check 5: check if the columns are the same as the required columns
-        if df["transactionHash"].is_null().any():
+        if stats["transactionHash__nulls"]:
             return False, "transactionHash is null", None, None, None
-        if df["timestamp_datetime"].is_null().any():
+        if stats["timestamp_datetime__nulls"]:
             return False, "timestamp_datetime is null", None, None, None
-        if df["topic_0"].is_null().any():
+        if stats["topic_0__nulls"]:
             return False, "topic_0 is null", None, None, None
         
         # Check 6: Amounts: non-negative
-        if (df["filled_relay_data_input_amount"] < 0).any():
-            return False, "filled_relay_data_input_amount is negative", None, None, None
-        if (df["filled_relay_data_output_amount"] < 0).any():
-            return False, "filled_relay_data_output_amount is negative", None, None, None
-        if (df["funds_deposited_data_input_amount"] < 0).any():
-            return False, "funds_deposited_data_input_amount is negative", None, None, None
-        if (df["funds_deposited_data_output_amount"] < 0).any():
-            return False, "funds_deposited_data_output_amount is negative", None, None, None
-        if (df["amount_to_return"] < 0).any():
-            return False, "amount_to_return is negative", None, None, None
-        # refund_count is Int64, so check it separately
-        if (df["refund_count"].is_not_null() & (df["refund_count"] < 0)).any():
-            return False, "refund_count is negative", None, None, None
+        for col in amount_cols + ["refund_count"]:
+            if col in numeric_neg_cols:
+                is_negative = stats[f"{col}__neg"]
+            else:
+                is_negative = (df[col] < 0).any()
+            if is_negative:
+                return False, f"{col} is negative", None, None, None
 
         # Check 7: Data types vs. expected types (at least high-level, e.g., amounts numeric-like, timestamps parseable).
-        if df["filled_relay_data_input_amount"].is_not_null().any() and df["filled_relay_data_input_amount"].dtype != pl.Float64:
-            return False, "filled_relay_data_input_amount is not a float64", None, None, None
-        if df["filled_relay_data_output_amount"].is_not_null().any() and df["filled_relay_data_output_amount"].dtype != pl.Float64:
-            return False, "filled_relay_data_output_amount is not a float64", None, None, None
-        if df["funds_deposited_data_input_amount"].is_not_null().any() and df["funds_deposited_data_input_amount"].dtype != pl.Float64:
-            return False, "funds_deposited_data_input_amount is not a float64", None, None, None
-        if df["funds_deposited_data_output_amount"].is_not_null().any() and df["funds_deposited_data_output_amount"].dtype != pl.Float64:
-            return False, "funds_deposited_data_output_amount is not a float64", None, None, None
-        if df["amount_to_return"].is_not_null().any() and df["amount_to_return"].dtype != pl.Float64:
-            return False, "amount_to_return is not a float64", None, None, None
+        for col in amount_cols:
+            if stats[f"{col}__any"] and df.schema[col] != pl.Float64:
+                return False, f"{col} is not a float64", None, None, None
         # refund_amounts and refund_addresses are comma-separated strings (Utf8)
-        if df["refund_amounts"].is_not_null().any() and df["refund_amounts"].dtype != pl.Utf8:
+        if stats["refund_amounts__any"] and df.schema["refund_amounts"] != pl.Utf8:
             return False, "refund_amounts is not a string (Utf8)", None, None, None
-        if df["refund_addresses"].is_not_null().any() and df["refund_addresses"].dtype != pl.Utf8:
+        if stats["refund_addresses__any"] and df.schema["refund_addresses"] != pl.Utf8:
             return False, "refund_addresses is not a string (Utf8)", None, None, None
-        if df["refund_count"].is_not_null().any() and df["refund_count"].dtype != pl.Int64:
+        if stats["refund_count__any"] and df.schema["refund_count"] != pl.Int64:
             return False, "refund_count is not an Int64", None, None, None
 
         # Check 8: Timestamps: parseable; not in scientific notation.
-        if df["timestamp_datetime"].is_not_null().any() and df["timestamp_datetime"].dtype != pl.Datetime:
+        if stats["timestamp_datetime__any"] and df.schema["timestamp_datetime"] != pl.Datetime:
             return False, "timestamp_datetime is not a datetime", None, None, None
 
         # Check 9: Strict Address & Hash format (startswith 0x, length 42 or 66)
-        # Note: refund_addresses is excluded as it is a CSV string of addresses
-        address_cols = [
-            "topic_relayer",
-            "filled_relay_data_input_token",
-            "filled_relay_data_output_token",
-            "filled_relay_data_exclusive_relayer",
-            "filled_relay_data_depositor",
-            "filled_relay_data_recipient",
-            "topic_depositor",
-            "funds_deposited_data_input_token",
-            "funds_deposited_data_output_token",
-            "funds_deposited_data_recipient",
-            "l2_token_address"
-        ]
-
         for col in address_cols:
-            if col in df.columns and df[col].is_not_null().any():
-                if df[col].dtype != pl.Utf8:
+            if stats[f"{col}__any"]:
+                if df.schema[col] != pl.Utf8:
                     return False, f"{col} is not a string", None, None, None
-                
-                # Check for 0x prefix and length 42
-                bad_addr = df.filter(
-                    pl.col(col).is_not_null() & 
-                    (~pl.col(col).str.starts_with("0x") | (pl.col(col).str.len_chars() != 42))
-                )
-                if not bad_addr.is_empty():
+                if stats[f"{col}__bad"]:
                      return False, f"{col} contains invalid addresses (must be 0x... and 42 chars)", None, None, None
 
-        if "transactionHash" in df.columns:
-            if df["transactionHash"].is_not_null().any():
-                if df["transactionHash"].dtype != pl.Utf8:
-                    return False, "transactionHash is not a string", None, None, None
-                
-                bad_hash = df.filter(
-                    pl.col("transactionHash").is_not_null() & 
-                    (~pl.col("transactionHash").str.starts_with("0x") | (pl.col("transactionHash").str.len_chars() != 66))
-                )
-                if not bad_hash.is_empty():
-                     return False, "transactionHash contains invalid hashes (must be 0x... and 66 chars)", None, None, None
+        # transactionHash has no nulls at this point (check 5)
+        if not hash_is_utf8:
+            return False, "transactionHash is not a string", None, None, None
+        if stats["transactionHash__bad"]:
+             return False, "transactionHash contains invalid hashes (must be 0x... and 66 chars)", None, None, None
 
         # Check 10: Gas data completeness - ensure no missing gasPrice/gasUsed for any log
-        total_logs = len(df)
-        gas_price_count = df["gas_price_wei"].is_not_null().sum()
-        gas_used_count = df["gas_used"].is_not_null().sum()
-        if gas_price_count != total_logs:
-            missing_count = total_logs - gas_price_count
-            return False, f"gas_price_wei has {missing_count} missing values out of {total_logs} logs", None, None, None
-        if gas_used_count != total_logs:
-            missing_count = total_logs - gas_used_count
-            return False, f"gas_used has {missing_count} missing values out of {total_logs} logs", None, None, None
+        total_logs = row_count
+        for col in ["gas_price_wei", "gas_used"]:
+            # df[col] raises for a missing column, as before the fused select
+            missing_count = stats[f"{col}__nulls"] if col in gas_cols else df[col].null_count()
+            if missing_count:
+                return False, f"{col} has {missing_count} missing values out of {total_logs} logs", None, None, None
 
         # Check 11: Future timestamps - no timestamps should be after current time
-        # Use timezone-naive datetime since parquet data is typically naive
-        from datetime import timezone as tz
-        current_time = datetime.now(tz.utc).replace(tzinfo=None)
-        future_timestamps = df.filter(
-            pl.col("timestamp_datetime").is_not_null() & 
-            (pl.col("timestamp_datetime") > current_time)
-        )
-        if not future_timestamps.is_empty():
-            future_count = len(future_timestamps)
-            max_future = future_timestamps.select(pl.col("timestamp_datetime").max()).item()
+        if not ts_is_naive:
+            # e.g. tz-aware timestamps: same per-frame filter as before the fused select
+            future_timestamps = df.filter(is_future)
+            if not future_timestamps.is_empty():
+                max_future = future_timestamps.select(pl.col("timestamp_datetime").max()).item()
+                return False, f"Found {len(future_timestamps)} logs with future timestamps (max: {max_future})", None, None, None
+        elif stats["future__count"]:
+            future_count = stats["future__count"]
+            max_future = stats["future__max"]
             return False, f"Found {future_count} logs with future timestamps (max: {max_future})", None, None, None
 
         # Check 12: Chain ID consistency - chain_id in data should match filename chain
@@ -216,12 +249,11 @@ def validate(file_path: Path) -> Tuple[bool, Optional[str], Optional[datetime],
                     sample_ids = mismatched.select(pl.col("chain_id")).unique().to_series().to_list()[:5]
                     return False, f"Chain ID mismatch: file is for {chain_name} (id={expected_chain_id}) but found {mismatch_count} logs with chain_id {sample_ids}", None, None, None
 
-        # Get date range from timestamp_datetime column
-        min_date, max_date = None, None
-        if "timestamp_datetime" in df.columns:
-            dates = df.select(pl.col("timestamp_datetime")).to_series()
-            min_date = dates.min()
-            max_date = dates.max()
+        # Date range from timestamp_datetime column (already aggregated above)
+        if ts_is_naive:
+            min_date, max_date = stats["ts__min"], stats["ts__max"]
+        else:
+            min_date, max_date = df["timestamp_datetime"].min(), df["timestamp_datetime"].max()
 
         # All checks passed
         return True, None, min_date, max_date, row_count
@@ -42,23 +42,34 @@ def get_parquet_stats(processed_dir: Path) -> Dict[str, dict]:
         chain = parquet_file.stem.split("_")[1]  # logs_arbitrum_... -> arbitrum
         table_name = f"{chain}_logs_processed"
         
-        df = pl.read_parquet(parquet_file)
+        # Lazy scan + one select: only the columns below are read from the
+        # file (Parquet is columnar), and all aggregates run in a single pass
+        lf = pl.scan_parquet(parquet_file)
+        file_columns = lf.collect_schema().names()
         
         # Count NULLs for critical columns (use lowercase for consistency)
-        null_counts = {}
-        for col in CRITICAL_COLUMNS:
-            # Parquet uses camelCase, DB uses lowercase
-            pq_col = "transactionHash" if col == "transactionhash" else col
-            if pq_col in df.columns:
-                null_counts[col] = df[pq_col].null_count()
+        # Parquet uses camelCase, DB uses lowercase
+        null_columns = {
+            col: "transactionHash" if col == "transactionhash" else col
+            for col in CRITICAL_COLUMNS
+        }
+        null_columns = {col: pq_col for col, pq_col in null_columns.items() if pq_col in file_columns}
+        
+        row = lf.select(
+            pl.len().alias("row_count"),
+            pl.col("timestamp_datetime").min().alias("min_ts"),
+            pl.col("timestamp_datetime").max().alias("max_ts"),
+            pl.col("transactionHash").n_unique().alias("unique_tx"),
+            *[pl.col(pq_col).null_count().alias(f"{col}__nulls") for col, pq_col in null_columns.items()],
+        ).collect().row(0, named=True)
         
         stats[table_name] = {
             "source_file": parquet_file.name,
-            "row_count": len(df),
-            "min_ts": df["timestamp_datetime"].min(),
-            "max_ts": df["timestamp_datetime"].max(),
-            "unique_tx": df["transactionHash"].n_unique(),
-            "null_counts": null_counts,
+            "row_count": row["row_count"],
+            "min_ts": row["min_ts"],
+            "max_ts": row["max_ts"],
+            "unique_tx": row["unique_tx"],
+            "null_counts": {col: row[f"{col}__nulls"] for col in null_columns},
         }
     return stats
 
@@ -1,12 +1,17 @@
 import polars as pl
 from pathlib import Path
 import time
+from binascii import a2b_hex
 from eth_abi import decode as abi_decode, encode  # For decoding/encoding dynamic arrays in event data
 import os
-import glob
 import json
 import sys
+import io
+from contextlib import redirect_stdout
 from typing import Optional, Dict, Any
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import multiprocessing
 
 # Add src to path for config import
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
@@ -16,21 +21,25 @@ from config import PATHS
 PROJECT_ROOT = PATHS["project_root"]
 
 
+@lru_cache(maxsize=None)
+def _load_chains_config(json_path: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Load the chains configuration once per path, keyed by lowercase chain name.
+    
+    Cached so repeated get_chain_params() calls (one per file in a batch run)
+    become a single dict lookup instead of re-reading and re-parsing the JSON.
+    """
+    with open(Path(json_path), 'r', encoding='utf-8') as file:
+        chains_data = json.load(file)
+    return {name.lower(): params for name, params in chains_data.items()}
+
+
 def get_chain_params(chain_name: str, json_path: str = os.path.join(PROJECT_ROOT, "data", "seeds", "tokens_contracts_per_chain.json")) -> Optional[Dict[str, Any]]:
     """
     Retrieve all parameters for a specific blockchain chain from the tokens configuration file.
     """
-    config_path = Path(json_path)
-    with open(config_path, 'r', encoding='utf-8') as file:
-        chains_data = json.load(file)
-    
-    # Convert the input chain_name to lowercase for case-insensitive matching
-    chain_name_lower = chain_name.lower()
-    
-    # Retrieve the chain parameters using the lowercase key
-    chain_params = chains_data.get(chain_name_lower)
-    
-    return chain_params
+    # Case-insensitive match: config keys are lowercased once at load time
+    return _load_chains_config(str(json_path)).get(chain_name.lower())
 
 
 def hex_to_int(hex_col: pl.Expr) -> pl.Expr:
@@ -38,7 +47,9 @@ def hex_to_int(hex_col: pl.Expr) -> pl.Expr:
     Convert hex string (like "0x692f6f7b") to integer.
     Returns NULL if value exceeds Int64 max (~9.2×10^18).
     """
-    return hex_col.str.replace("0x", "").str.to_integer(base=16, strict=False)
+    # strip_prefix is a fixed-prefix slice; str.replace would compile "0x" as a
+    # regex and scan the whole string on every row
+    return hex_col.str.strip_prefix("0x").str.to_integer(base=16, strict=False)
 
 def hex_to_address(hex_col: pl.Expr) -> pl.Expr:
     """
@@ -78,24 +89,30 @@ def decode_topics(
         funds_deposited: Event signature hash for FundsDeposited event
         executed_relayer_refund_root: Event signature hash for ExecutedRelayerRefundRoot event
     """
+    # topic_1 / topic_2 are uint256 for every event type: build the hex -> int
+    # conversion once and reuse it in each struct, so the parse is shared
+    # instead of being spelled out (and planned) three times per topic
+    topic_1_int = hex_to_int(pl.col("topic_1"))
+    topic_2_int = hex_to_int(pl.col("topic_2"))
+
     # FILLED_RELAY topics
     filled_relay_struct = pl.struct([
-        hex_to_int(pl.col("topic_1")).alias("topic_origin_chain_id"),
-        hex_to_int(pl.col("topic_2")).alias("topic_deposit_id"),
+        topic_1_int.alias("topic_origin_chain_id"),
+        topic_2_int.alias("topic_deposit_id"),
         hex_to_address(pl.col("topic_3")).alias("topic_relayer"),
     ])
     
     # EXECUTED_RELAYER_REFUND_ROOT topics
     executed_refund_struct = pl.struct([
-        hex_to_int(pl.col("topic_1")).alias("topic_chain_id"),
-        hex_to_int(pl.col("topic_2")).alias("topic_root_bundle_id"),
+        topic_1_int.alias("topic_chain_id"),
+        topic_2_int.alias("topic_root_bundle_id"),
         hex_to_int(pl.col("topic_3")).alias("topic_leaf_id"),
     ])
     
     # FUNDS_DEPOSITED topics
     funds_deposited_struct = pl.struct([
-        hex_to_int(pl.col("topic_1")).alias("topic_destination_chain_id"),
-        hex_to_int(pl.col("topic_2")).alias("topic_deposit_id"),
+        topic_1_int.alias("topic_destination_chain_id"),
+        topic_2_int.alias("topic_deposit_id"),
         hex_to_address(pl.col("topic_3")).alias("topic_depositor"),
     ])
     
@@ -108,6 +125,25 @@ def decode_topics(
     )
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+# RAW LOG SCHEMA - only the JSONL fields the transform actually reads
+# ─────────────────────────────────────────────────────────────────────────────
+# Passing an explicit schema to scan_ndjson:
+# - Skips schema inference (no extra pass over the first rows of every file)
+# - Parses only these keys; unused ones (address, logIndex, removed, ...) are
+#   never materialized, which cuts peak memory on large files
+# - Keys missing from a record are read as NULL, same as with inference
+RAW_LOG_SCHEMA = {
+    "timeStamp": pl.String,
+    "blockNumber": pl.String,
+    "gasPrice": pl.String,
+    "gasUsed": pl.String,
+    "transactionHash": pl.String,
+    "topics": pl.List(pl.String),
+    "data": pl.String,
+}
+
+
 # SLOT EXTRACTORS (for decoding the 'data' field) - atomic helpers that extract ONE 32-byte slot from hex data
 def _slot_as_int(data_col: pl.Expr, slot: int) -> pl.Expr:
     """
@@ -125,64 +161,31 @@ def _slot_as_int(data_col: pl.Expr, slot: int) -> pl.Expr:
     
     How it works:
     ─────────────────────────────────────────────────────────────────────────────
-    1. Try parsing full 64-char hex as Int64 (fast path, works for ~99% of values)
-    2. If overflow (NULL), split into 8 × 8-char chunks (32 bits each):
-       - Each 8-char chunk = 32 bits, max 4.29×10^9, always fits in Int64
-       - Combine: v7×2^224 + v6×2^192 + ... + v1×2^32 + v0
-    3. Return Float64 in all cases
+    1. Split the 64-char hex slot into 2 × 32-char limbs (128 bits each)
+    2. Parse each limb natively as UInt128 - always fits, never overflows
+    3. Combine in Float64: hi×2^128 + lo
+    
+    Only 2 hex parses per slot (previously 1 Int64 attempt + 8 × 32-bit
+    chunks). Real-world values never exceed 2^128, so hi is 0 and lo is
+    converted with a single correctly-rounded cast.
     
     Trade-off: For very large numbers (> 2^53), may lose precision in the
     least significant digits. Acceptable for analytics purposes.
     """
     offset = 2 + (slot * 64)
     
-    # Extract the 64-char hex string for this slot
-    hex_str = data_col.str.slice(offset, 64)
-    
-    # Fast path: try parsing as Int64 directly, then cast to Float64
-    # Works for values up to ~9.2×10^18 (covers 99% of cases)
-    fast_result = hex_str.str.to_integer(base=16, strict=False).cast(pl.Float64)
-    
-    # ─────────────────────────────────────────────────────────────────────────
-    # Fallback for large values: split into 8 × 8-char chunks (32 bits each)
-    # Each 8-char hex = 32 bits = max 4,294,967,295. ALWAYS fits in Int64.
     # ─────────────────────────────────────────────────────────────────────────
     # Slot layout (64 hex chars = 256 bits):
-    # [v7: 8 chars][v6: 8 chars][v5: 8 chars][v4: 8 chars][v3: 8 chars][v2: 8 chars][v1: 8 chars][v0: 8 chars]
-    #  bits 224-255  192-223     160-191     128-159      96-127       64-95        32-63        0-31
-    
-    v7 = data_col.str.slice(offset,      8).str.to_integer(base=16, strict=False).cast(pl.Float64).fill_null(0.0)
-    v6 = data_col.str.slice(offset + 8,  8).str.to_integer(base=16, strict=False).cast(pl.Float64).fill_null(0.0)
-    v5 = data_col.str.slice(offset + 16, 8).str.to_integer(base=16, strict=False).cast(pl.Float64).fill_null(0.0)
-    v4 = data_col.str.slice(offset + 24, 8).str.to_integer(base=16, strict=False).cast(pl.Float64).fill_null(0.0)
-    v3 = data_col.str.slice(offset + 32, 8).str.to_integer(base=16, strict=False).cast(pl.Float64).fill_null(0.0)
-    v2 = data_col.str.slice(offset + 40, 8).str.to_integer(base=16, strict=False).cast(pl.Float64).fill_null(0.0)
-    v1 = data_col.str.slice(offset + 48, 8).str.to_integer(base=16, strict=False).cast(pl.Float64).fill_null(0.0)
-    v0 = data_col.str.slice(offset + 56, 8).str.to_integer(base=16, strict=False).cast(pl.Float64).fill_null(0.0)
-    
-    # Combine: v7×2^224 + v6×2^192 + v5×2^160 + v4×2^128 + v3×2^96 + v2×2^64 + v1×2^32 + v0
-    # Pre-computed powers of 2^32 for efficiency
-    TWO_32  = 4294967296.0                    # 2^32
-    TWO_64  = 18446744073709551616.0          # 2^64
-    TWO_96  = 79228162514264337593543950336.0 # 2^96
-    TWO_128 = TWO_64 * TWO_64                 # 2^128
-    TWO_160 = TWO_128 * TWO_32                # 2^160
-    TWO_192 = TWO_128 * TWO_64                # 2^192
-    TWO_224 = TWO_192 * TWO_32                # 2^224
-    
-    large_result = (
-        v7 * TWO_224 +
-        v6 * TWO_192 +
-        v5 * TWO_160 +
-        v4 * TWO_128 +
-        v3 * TWO_96 +
-        v2 * TWO_64 +
-        v1 * TWO_32 +
-        v0
-    )
+    # [hi: 32 chars][lo: 32 chars]
+    #  bits 128-255  bits 0-127
+    # ─────────────────────────────────────────────────────────────────────────
+    # fill_null(0.0): a missing/short slot (or NULL data) decodes to 0.0, not NULL
+    hi = data_col.str.slice(offset,      32).str.to_integer(base=16, dtype=pl.UInt128, strict=False).cast(pl.Float64).fill_null(0.0)
+    lo = data_col.str.slice(offset + 32, 32).str.to_integer(base=16, dtype=pl.UInt128, strict=False).cast(pl.Float64).fill_null(0.0)
+    
+    TWO_128 = 340282366920938463463374607431768211456.0  # 2^128
     
-    # Use fast path if it worked, otherwise use the large number fallback
-    return fast_result.fill_null(large_result)
+    return hi * TWO_128 + lo
 
 def _slot_as_address(data_col: pl.Expr, slot: int) -> pl.Expr:
     """
@@ -196,14 +199,6 @@ def _slot_as_address(data_col: pl.Expr, slot: int) -> pl.Expr:
     # Skip 24-char left-padding, take the 40-char address
     return pl.lit("0x") + data_col.str.slice(offset + 24, 40)
 
-def _slot_as_bytes32(data_col: pl.Expr, slot: int) -> pl.Expr:
-    """
-    Extract a 32-byte slot as raw hex string (for hashes, identifiers).
-    No interpretation - just extract and prefix with "0x".
-    """
-    offset = 2 + (slot * 64)
-    return pl.lit("0x") + data_col.str.slice(offset, 64)
-
 # EVENT STRUCT BUILDERS (for 'data' field) - build Polars structs for each event type
 def _build_filled_relay_struct(data_col: pl.Expr) -> pl.Expr:
     """
@@ -246,16 +241,15 @@ def _build_filled_relay_struct(data_col: pl.Expr) -> pl.Expr:
         
         # Chain and timing
         _slot_as_int(data_col, 4).alias("filled_relay_data_repayment_chain_id"),
-        _slot_as_int(data_col, 5).alias("filled_relay_data_fill_deadline"),
-        _slot_as_int(data_col, 6).alias("filled_relay_data_exclusivity_deadline"),
+        # Slots 5-6 (fill_deadline, exclusivity_deadline) not decoded: never
+        # selected, and struct fields are computed for every row
         
         # Addresses
         _slot_as_address(data_col, 7).alias("filled_relay_data_exclusive_relayer"),
         _slot_as_address(data_col, 8).alias("filled_relay_data_depositor"),
         _slot_as_address(data_col, 9).alias("filled_relay_data_recipient"),
         
-        # Message
-        _slot_as_bytes32(data_col, 10).alias("filled_relay_data_message_hash"),
+        # Slot 10 (message_hash) not decoded: never selected
     ])
 
 def _build_funds_deposited_struct(data_col: pl.Expr) -> pl.Expr:
@@ -284,17 +278,96 @@ def _build_funds_deposited_struct(data_col: pl.Expr) -> pl.Expr:
         _slot_as_int(data_col, 2).alias("funds_deposited_data_input_amount"), #input amount on origin chain
         _slot_as_int(data_col, 3).alias("funds_deposited_data_output_amount"), #output amount on destination chain
         
-        # Timing
-        _slot_as_int(data_col, 4).alias("funds_deposited_data_quote_timestamp"), #quote timestamp
-        _slot_as_int(data_col, 5).alias("funds_deposited_data_fill_deadline"), #fill deadline
-        _slot_as_int(data_col, 6).alias("funds_deposited_data_exclusivity_deadline"), #exclusivity deadline
-        
         # Addresses
         _slot_as_address(data_col, 7).alias("funds_deposited_data_recipient"), #recipient address on destination chain
-        _slot_as_address(data_col, 8).alias("funds_deposited_data_exclusive_relayer"),
+        
+        # Slots 4-6 (quote_timestamp, fill_deadline, exclusivity_deadline) and
+        # 8 (exclusive_relayer) not decoded: never selected
     ])
 
-def _decode_executed_refund_data(data_hex: str) -> dict | None:
+# ─────────────────────────────────────────────────────────────────────────────
+# EXECUTED_REFUND decoding constants - built ONCE at import, shared by every row
+# ─────────────────────────────────────────────────────────────────────────────
+# ABI types for non-indexed params (in declaration order).
+# eth_abi handles offset pointers and tail section parsing automatically.
+_REFUND_ABI_TYPES = (
+    'uint256',    # amountToReturn
+    'uint256[]',  # refundAmounts (dynamic array)
+    'address',    # l2TokenAddress
+    'address[]',  # refundAddresses (dynamic array)
+    'bool',       # deferredRefunds
+    'address',    # caller
+)
+
+# Output struct dtype - the decoder fills one Python list per field (SoA) and
+# Polars builds the columns directly, instead of inferring a struct from a
+# dict per row.
+# NOTE: deferred_refunds and caller SKIPPED (not needed for capital flow)
+_REFUND_STRUCT_DTYPE = pl.Struct([
+    pl.Field("amount_to_return", pl.Float64),
+    pl.Field("l2_token_address", pl.Utf8),
+    pl.Field("refund_amounts", pl.Utf8),        # Comma-separated string
+    pl.Field("refund_addresses", pl.Utf8),      # Comma-separated string
+    pl.Field("refund_count", pl.Int64),         # Count of refunds
+    # pl.Field("deferred_refunds", pl.Boolean), # SKIPPED: execution flag
+    # pl.Field("caller", pl.Utf8),              # SKIPPED: who called execute
+])
+
+# Fixed head of the refund payload: 6 slots × 32 bytes, in declaration order
+# [0] amountToReturn  [1] offset(refundAmounts)  [2] l2TokenAddress
+# [3] offset(refundAddresses)  [4] deferredRefunds  [5] caller
+_REFUND_HEAD_SIZE = 6 * 32
+_ADDRESS_PADDING = bytes(12)   # addresses are left-padded with 12 zero bytes
+_BOOL_PADDING = bytes(31)      # bools are left-padded with 31 zero bytes
+
+def _decode_refund_payload_fast(data_bytes: bytes) -> tuple | None:
+    """
+    Decode a canonically encoded ExecutedRelayerRefundRoot payload directly.
+    
+    Every refund log the SpokePool emits uses the standard layout: the fixed
+    192-byte head, then refundAmounts (length + elements) immediately
+    followed by refundAddresses (length + elements). For that layout the
+    fields sit at known positions, so they are read with plain slices and
+    int.from_bytes - no generic ABI decoder walk per row.
+    
+    Returns None for anything that is not exactly this layout (unexpected
+    offsets, trailing bytes, bad padding); the caller then falls back to
+    eth_abi, which either decodes it or rejects it as before.
+    """
+    from_bytes = int.from_bytes
+    head = _REFUND_HEAD_SIZE
+    
+    # refundAmounts must start right after the head
+    if len(data_bytes) < head + 64 or from_bytes(data_bytes[32:64], "big") != head:
+        return None
+    amounts_end = head + 32 + 32 * from_bytes(data_bytes[head:head + 32], "big")
+    # ...and refundAddresses right after refundAmounts
+    if from_bytes(data_bytes[96:128], "big") != amounts_end:
+        return None
+    addresses_start = amounts_end + 32
+    if len(data_bytes) != addresses_start + 32 * from_bytes(data_bytes[amounts_end:addresses_start], "big"):
+        return None
+    
+    # Padding checks (same strictness as eth_abi): l2TokenAddress, deferredRefunds, caller
+    if (data_bytes[64:76] != _ADDRESS_PADDING
+            or data_bytes[128:159] != _BOOL_PADDING or data_bytes[159] > 1
+            or data_bytes[160:172] != _ADDRESS_PADDING):
+        return None
+    
+    refund_addresses = []
+    for i in range(addresses_start, len(data_bytes), 32):
+        if data_bytes[i:i + 12] != _ADDRESS_PADDING:
+            return None
+        refund_addresses.append("0x" + data_bytes[i + 12:i + 32].hex())
+    
+    return (
+        from_bytes(data_bytes[0:32], "big"),                                             # amountToReturn
+        [from_bytes(data_bytes[i:i + 32], "big") for i in range(head + 32, amounts_end, 32)],  # refundAmounts
+        "0x" + data_bytes[76:96].hex(),                                                  # l2TokenAddress (lowercase)
+        refund_addresses,                                                                # refundAddresses (lowercase)
+    )
+
+def _decode_executed_refund_data(data_hex: str) -> tuple | None:
     """
     Decode ExecutedRelayerRefundRoot event data including dynamic arrays.
     
@@ -317,96 +390,111 @@ def _decode_executed_refund_data(data_hex: str) -> dict | None:
     
     Note: chainId, rootBundleId, leafId are INDEXED (in topics, not in data).
     
-    IMPORTANT: This function is called via map_elements which applies to ALL rows
-    before when/then filtering. Returns None for non-matching event data layouts
-    to prevent crashes when decoding other event types.
-    
     Args:
         data_hex: Raw hex string from event data field (e.g., "0x000...abc")
     
     Returns:
-        Dictionary with decoded fields, or None if decoding fails (wrong event type)
+        Tuple of decoded fields in _REFUND_STRUCT_DTYPE order,
+        or None if the payload is missing or fails to decode
     """
-    # ─────────────────────────────────────────────────────────────────────────
-    # Null struct template - returned when decoding fails (wrong event type)
-    # Polars requires a dict with all fields present; None values become nulls
-    # NOTE: deferred_refunds and caller SKIPPED (not needed for capital flow)
-    # ─────────────────────────────────────────────────────────────────────────
-    NULL_STRUCT = {
-        "amount_to_return": None,
-        "l2_token_address": None,
-        "refund_amounts": None,
-        "refund_addresses": None,
-        "refund_count": None,
-        # "deferred_refunds": None,  # SKIPPED: execution flag, not capital
-        # "caller": None,            # SKIPPED: who called, not who receives
-    }
-    
     try:
         # ─────────────────────────────────────────────────────────────────────
-        # Step 0: Guard against None input (can happen with skip_nulls=False)
+        # Step 0: Guard against None input (non-refund rows are masked to NULL)
         # ─────────────────────────────────────────────────────────────────────
         if data_hex is None:
-            return NULL_STRUCT
+            return None
             
         # ─────────────────────────────────────────────────────────────────────
         # Step 1: Convert hex string to bytes (remove '0x' prefix)
+        # a2b_hex is a plain C hex loop (~3x faster than bytes.fromhex, which
+        # also scans for whitespace); invalid hex still raises -> null struct
         # ─────────────────────────────────────────────────────────────────────
-        data_bytes = bytes.fromhex(data_hex[2:])
+        data_bytes = a2b_hex(data_hex[2:])
         
         # ─────────────────────────────────────────────────────────────────────
-        # Step 2: Define ABI types for non-indexed params (in declaration order)
-        # eth_abi handles offset pointers and tail section parsing automatically
+        # Step 2: Decode the fields - fast path for the standard layout,
+        # eth_abi for anything else (types defined at module level)
         # ─────────────────────────────────────────────────────────────────────
-        types = [
-            'uint256',    # amountToReturn
-            'uint256[]',  # refundAmounts (dynamic array)
-            'address',    # l2TokenAddress
-            'address[]',  # refundAddresses (dynamic array)
-            'bool',       # deferredRefunds
-            'address'     # caller
-        ]
+        decoded = _decode_refund_payload_fast(data_bytes)
+        if decoded is not None:
+            amount_to_return, refund_amounts, l2_token_address, refund_addresses = decoded
+        else:
+            # The library returns arrays as Python tuples
+            (
+                amount_to_return,
+                refund_amounts,      # Tuple of uint256 values
+                l2_token_address,
+                refund_addresses,    # Tuple of address strings
+                deferred_refunds,
+                caller
+            ) = abi_decode(_REFUND_ABI_TYPES, data_bytes)
         
         # ─────────────────────────────────────────────────────────────────────
-        # Step 3: Decode all fields in one call
-        # The library returns arrays as Python tuples
-        # ─────────────────────────────────────────────────────────────────────
-        (
-            amount_to_return,
-            refund_amounts,      # Tuple of uint256 values
-            l2_token_address,
-            refund_addresses,    # Tuple of address strings
-            deferred_refunds,
-            caller
-        ) = abi_decode(types, data_bytes)
-        
-        # ─────────────────────────────────────────────────────────────────────
-        # Step 4: Return as dictionary for Polars struct conversion
+        # Step 3: Return fields in struct order (no per-row dict)
         # Arrays are stored as comma-separated strings (Polars-friendly format)
         # NOTE: deferred_refunds and caller SKIPPED (not needed for capital flow)
         # ─────────────────────────────────────────────────────────────────────
-        return {
-            "amount_to_return": float(amount_to_return),        # Float64 for large values
-            "l2_token_address": l2_token_address,               # Checksum address string
-            "refund_amounts": ",".join(str(a) for a in refund_amounts),    # "100,200,300"
-            "refund_addresses": ",".join(refund_addresses),                 # "0xAAA,0xBBB"
-            "refund_count": len(refund_amounts),                # Number of refunds in this leaf
-            # "deferred_refunds": deferred_refunds,             # SKIPPED: execution flag
-            # "caller": caller                                  # SKIPPED: who called execute
-        }
+        return (
+            float(amount_to_return),                # amount_to_return: Float64 for large values
+            l2_token_address,                       # l2_token_address: lowercase 0x address (eth_abi normalizes)
+            ",".join(map(str, refund_amounts)),     # refund_amounts: "100,200,300"
+            ",".join(refund_addresses),             # refund_addresses: "0xaaa,0xbbb" (lowercase)
+            len(refund_amounts),                    # refund_count: number of refunds in this leaf
+        )
     except Exception:
         # ─────────────────────────────────────────────────────────────────────
-        # Return null struct for non-ExecutedRelayerRefundRoot events
-        # map_elements applies to ALL rows; the when/then filter happens AFTER
+        # Payloads that fail to decode become a null struct
         # ─────────────────────────────────────────────────────────────────────
-        return NULL_STRUCT
+        return None
+
+
+def _decode_executed_refund_batch(data: pl.Series) -> pl.Series:
+    """
+    Decode a whole column of refund payloads into a struct Series.
+    
+    Column-oriented (SoA) output: each decoded field is appended to its own
+    list and Polars builds one typed column per field, instead of converting
+    a dict per row into a struct. Rows that are NULL (non-refund events) or
+    fail to decode get NULL in every field.
+    
+    NULL handling is done once for the whole Series: only the non-null
+    payloads are pulled into Python and decoded, and the results are
+    scattered back to their row positions. Non-refund rows (the vast
+    majority) never go through the per-row loop.
+    """
+    schema = {field.name: field.dtype for field in _REFUND_STRUCT_DTYPE.fields}
+    columns = tuple([] for _ in schema)
+    null_row = (None,) * len(columns)
+    
+    is_present = data.is_not_null()
+    for data_hex in data.filter(is_present).to_list():
+        decoded = _decode_executed_refund_data(data_hex) or null_row
+        for column, value in zip(columns, decoded):
+            column.append(value)
+    
+    # One typed Series per field, built straight from its list (no intermediate
+    # DataFrame). If every row had a payload these are already row-aligned.
+    decoded = [
+        pl.Series(name, column, dtype=dtype)
+        for (name, dtype), column in zip(schema.items(), columns)
+    ]
+    
+    # Otherwise place the decoded rows at their positions in all-NULL columns
+    if len(decoded[0]) != len(data):
+        positions = is_present.arg_true()
+        decoded = [
+            pl.Series(series.name, dtype=series.dtype).extend_constant(None, len(data)).scatter(positions, series)
+            for series in decoded
+        ]
+    
+    return pl.DataFrame(decoded).to_struct(data.name)
 
 
 def _build_executed_refund_struct(data_col: pl.Expr) -> pl.Expr:
     """
     Build decoded struct for ExecutedRelayerRefundRoot event.
     
-    Uses map_elements to apply _decode_executed_refund_data() row-by-row.
+    Uses map_batches to run _decode_executed_refund_data() over the column.
     This is necessary because dynamic arrays require offset-based decoding
     that cannot be expressed as pure Polars columnar operations.
     
@@ -416,18 +504,10 @@ def _build_executed_refund_struct(data_col: pl.Expr) -> pl.Expr:
     - Returns proper struct that integrates with existing pipeline
     """
     # NOTE: deferred_refunds and caller SKIPPED at source (not needed for capital flow)
-    # Since map_elements is a black box to Polars optimizer, we skip early here
-    return data_col.map_elements(
-        _decode_executed_refund_data,
-        return_dtype=pl.Struct([
-            pl.Field("amount_to_return", pl.Float64),
-            pl.Field("l2_token_address", pl.Utf8),
-            pl.Field("refund_amounts", pl.Utf8),        # Comma-separated string
-            pl.Field("refund_addresses", pl.Utf8),      # Comma-separated string
-            pl.Field("refund_count", pl.Int64),         # Count of refunds
-            # pl.Field("deferred_refunds", pl.Boolean), # SKIPPED: execution flag
-            # pl.Field("caller", pl.Utf8),              # SKIPPED: who called execute
-        ])
+    # Callers mask non-refund rows to NULL, so only refund payloads reach eth_abi
+    return data_col.map_batches(
+        _decode_executed_refund_batch,
+        return_dtype=_REFUND_STRUCT_DTYPE,
     )
 
 # Decode the data field based on the event type
@@ -453,13 +533,19 @@ def decode_data(
         funds_deposited: Event signature hash for FundsDeposited event
         executed_relayer_refund_root: Event signature hash for ExecutedRelayerRefundRoot event
     """
+    # Mask 'data' to refund rows BEFORE the Python decoder: the batch decoder
+    # sees every row (not just the when/then branch), and decoding
+    # FilledRelay/FundsDeposited payloads would only raise and be discarded.
+    # NULL rows are skipped by the decoder, so only refund logs hit eth_abi.
+    refund_data = pl.when(topic0_col == executed_relayer_refund_root).then(data_col)
+    
     return (
         pl.when(topic0_col == filled_relay)
             .then(_build_filled_relay_struct(data_col))
         .when(topic0_col == funds_deposited)
             .then(_build_funds_deposited_struct(data_col))
         .when(topic0_col == executed_relayer_refund_root)
-            .then(_build_executed_refund_struct(data_col))
+            .then(_build_executed_refund_struct(refund_data))
         .otherwise(pl.lit(None))
     ).alias("decoded_data")
 
@@ -527,8 +613,8 @@ def transform_data(
     #print(f"Funds deposited: {funds_deposited}")
 
     result = (
-        # load file into a polar dataframe
-        pl.scan_ndjson(input_file)
+        # load file into a polar dataframe (explicit schema: no inference pass)
+        pl.scan_ndjson(input_file, schema=RAW_LOG_SCHEMA)
         
         # STEP 2: Extract topics[0..3] into separate columns
         .with_columns([
@@ -598,12 +684,12 @@ def transform_data(
             "filled_relay_data_input_amount",           # Amount sent from origin
             "filled_relay_data_output_amount",          # Amount received on destination
             "filled_relay_data_repayment_chain_id",     # Where relayer gets reimbursed
-            #"filled_relay_data_fill_deadline",         # SKIPPED: timing constraint for fill
-            #"filled_relay_data_exclusivity_deadline",  # SKIPPED: exclusive relayer window
+            #"filled_relay_data_fill_deadline",         # SKIPPED at source: timing constraint for fill
+            #"filled_relay_data_exclusivity_deadline",  # SKIPPED at source: exclusive relayer window
             "filled_relay_data_exclusive_relayer",      # Address with exclusive fill rights
             "filled_relay_data_depositor",              # Who initiated the bridge
             "filled_relay_data_recipient",              # Who received the funds
-            #"filled_relay_data_message_hash",          # SKIPPED: cross-chain message hash
+            #"filled_relay_data_message_hash",          # SKIPPED at source: cross-chain message hash
             
             # ═══════════════════════════════════════════════════════════════════
             # FUNDS_DEPOSITED - user chain → protocol chain (deposit side)
@@ -622,6 +708,7 @@ def transform_data(
             "funds_deposited_data_recipient",           # Final recipient of funds
 
             # Optional fields: Not required for capital flow analysis, commented out for now
+            # (also not decoded - re-enable in _build_funds_deposited_struct if needed)
             # "funds_deposited_data_quote_timestamp",     # When exchange rate quote was generated
             # "funds_deposited_data_fill_deadline",       # Deadline by which deposit must be filled
             # "funds_deposited_data_exclusivity_deadline", # Deadline for exclusive relayer rights
@@ -653,11 +740,52 @@ def transform_data(
     # print time taken
     print(f"✓ Transformed in {time.time() - time_start:.2f}s")
 
+
+# Max raw files transformed concurrently by the CLI (each process also uses Polars threads)
+MAX_PARALLEL_FILES = 4
+
+
+def transform_file(file: str) -> str:
+    """
+    Transform one raw JSONL file, deriving chain and dates from its name.
+    
+    Runs in a worker process, so its progress output is captured and returned
+    as one block; the parent prints it, keeping each file's lines together.
+    """
+    buffer = io.StringIO()
+    with redirect_stdout(buffer):
+        _transform_file(file)
+    return buffer.getvalue()
+
+
+def _transform_file(file: str) -> None:
+    # print file name to be processed
+    print("\n"+file)
+
+    # get chain name, start date, and end date from file name (split once)
+    # Filename format: logs_<chain>_<start_date>_to_<end_date>.jsonl
+    name_parts = os.path.basename(file).removesuffix(".jsonl").split("logs_", 1)[1].split("_")
+    chain = name_parts[0]
+    start_date = name_parts[1]
+    end_date = name_parts[3]
+    print(f"Chain: {chain} \nStart date: {start_date} \nEnd date: {end_date}")
+
+    # transform data (pass the actual file path)
+    transform_data(chain, start_date, end_date, input_file=Path(file))
+
+
 if __name__ == "__main__":
 
     # Collect files from BOTH data sources (etherscan_api and alchemy_api)
-    etherscan_files = glob.glob(os.path.join(PROJECT_ROOT, "data", "raw", "etherscan_api", "*.jsonl"))
-    alchemy_files = glob.glob(os.path.join(PROJECT_ROOT, "data", "raw", "alchemy_api", "*.jsonl"))
+    # os.scandir yields names from a single directory read (no glob pattern matching)
+    def list_jsonl_files(directory: str) -> list:
+        if not os.path.isdir(directory):
+            return []
+        with os.scandir(directory) as entries:
+            return [entry.path for entry in entries if entry.name.endswith(".jsonl") and entry.is_file()]
+    
+    etherscan_files = list_jsonl_files(os.path.join(PROJECT_ROOT, "data", "raw", "etherscan_api"))
+    alchemy_files = list_jsonl_files(os.path.join(PROJECT_ROOT, "data", "raw", "alchemy_api"))
     
     all_files = etherscan_files + alchemy_files
     
@@ -665,20 +793,17 @@ if __name__ == "__main__":
     print(f"Found {len(alchemy_files)} files from alchemy_api")
     print(f"Total files to process: {len(all_files)}")
 
-    # Process each file
-    for file in all_files:
-
-        # print file name to be processed
-        print("\n"+file)
-
-        # get chain name, start date, and end date from file name
-        chain = file.split("logs_")[1].split("_")[0]
-        start_date = file.split("logs_")[1].split("_")[1]
-        end_date = file.split("logs_")[1].split("_")[3].strip(".jsonl")
-        print(f"Chain: {chain} \nStart date: {start_date} \nEnd date: {end_date}")
-
-        # transform data (pass the actual file path)
-        transform_data(chain, start_date, end_date, input_file=Path(file))
+    # Process files in parallel: files are independent, and the refund decoder
+    # (map_batches + eth_abi) holds the GIL, so separate processes let it use
+    # several cores. "spawn" avoids forking Polars' thread pool; the worker cap
+    # keeps each process's own Polars threads from oversubscribing the CPU.
+    max_workers = max(1, min(len(all_files), MAX_PARALLEL_FILES))
+    # Each worker returns its file's summary lines; printing them here as files
+    # finish keeps the output of concurrent workers from interleaving.
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+        futures = [executor.submit(transform_file, file) for file in all_files]
+        for future in as_completed(futures):
+            print(future.result(), end="")
 
 
 
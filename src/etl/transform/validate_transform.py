@@ -3,9 +3,10 @@ Validate that all raw JSONL files have been transformed to Parquet.
 Checks for missing files, validates parquet readability, and compares row counts.
 """
 import polars as pl
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
 from pathlib import Path
 import sys
-import json
 
 # Add src to path for config import
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
@@ -19,6 +20,25 @@ RAW_DIRS = [
 PROCESSED_DIR = PROJECT_ROOT / "data" / "processed"
 
 
+def count_lines(file_path: Path, chunk_size: int = 1 << 20) -> int:
+    """
+    Count newline-terminated lines by scanning raw bytes in 1 MiB chunks.
+    
+    bytes.count() runs in C over each chunk, instead of decoding the file to
+    text and iterating it line by line in Python. A final line without a
+    trailing newline is counted too, same as iterating the file.
+    """
+    count = 0
+    last_byte = b"\n"
+    with open(file_path, 'rb') as f:
+        while chunk := f.read(chunk_size):
+            count += chunk.count(b"\n")
+            last_byte = chunk[-1:]
+    if last_byte != b"\n":
+        count += 1
+    return count
+
+
 def validate_gas_fields(file_path: Path) -> dict:
     """
     Check that every log entry has gasPrice and gasUsed fields.
@@ -30,28 +50,26 @@ def validate_gas_fields(file_path: Path) -> dict:
         - missing_gasUsed: int
         - missing_both: int
     """
-    total_logs = 0
-    missing_gasPrice = 0
-    missing_gasUsed = 0
-    missing_both = 0
-    
-    with open(file_path, 'r') as f:
-        for line_num, line in enumerate(f, 1):
-            if not line.strip():
-                continue
-            
-            total_logs += 1
-            log = json.loads(line)
-            
-            has_gasPrice = 'gasPrice' in log and log['gasPrice'] is not None
-            has_gasUsed = 'gasUsed' in log and log['gasUsed'] is not None
-            
-            if not has_gasPrice and not has_gasUsed:
-                missing_both += 1
-            elif not has_gasPrice:
-                missing_gasPrice += 1
-            elif not has_gasUsed:
-                missing_gasUsed += 1
+    # Scan only the two gas fields and count nulls in a single vectorized pass
+    # instead of json.loads()-ing every line in Python. A key that is absent
+    # from a record is read back as null, same as an explicit null value.
+    gas = pl.scan_ndjson(
+        file_path,
+        schema={"gasPrice": pl.String, "gasUsed": pl.String},
+    )
+    no_price = pl.col("gasPrice").is_null()
+    no_used = pl.col("gasUsed").is_null()
+    counts = gas.select(
+        pl.len().alias("total_logs"),
+        (no_price & no_used).sum().alias("missing_both"),
+        (no_price & ~no_used).sum().alias("missing_gasPrice"),
+        (~no_price & no_used).sum().alias("missing_gasUsed"),
+    ).collect().row(0, named=True)
+    
+    total_logs = counts["total_logs"]
+    missing_both = counts["missing_both"]
+    missing_gasPrice = counts["missing_gasPrice"]
+    missing_gasUsed = counts["missing_gasUsed"]
     
     return {
         "valid": missing_gasPrice == 0 and missing_gasUsed == 0 and missing_both == 0,
@@ -62,6 +80,45 @@ def validate_gas_fields(file_path: Path) -> dict:
     }
 
 
+def check_transformed_file(raw_file: Path) -> dict:
+    """
+    Run all checks for one raw file against its processed Parquet.
+    
+    Returns dict with:
+        - status: "missing", "error" or "checked"
+        - processed_name: expected Parquet file name
+        - error: exception message (status "error")
+        - raw_count, processed_count, gas_result (status "checked")
+    """
+    # Expected processed file name
+    processed_name = raw_file.stem + "_processed.parquet"
+    processed_file = PROCESSED_DIR / processed_name
+    
+    if not processed_file.exists():
+        return {"status": "missing", "processed_name": processed_name}
+    
+    try:
+        # Verify parquet is readable and get its row count from the footer
+        # metadata (no column data is decoded)
+        processed_count = pl.scan_parquet(processed_file).select(pl.len()).collect().item()
+        
+        # Count raw lines (each line = 1 log entry)
+        raw_count = count_lines(raw_file)
+        
+        # Validate gas fields
+        gas_result = validate_gas_fields(raw_file)
+    except Exception as e:
+        return {"status": "error", "processed_name": processed_name, "error": str(e)}
+    
+    return {
+        "status": "checked",
+        "processed_name": processed_name,
+        "raw_count": raw_count,
+        "processed_count": processed_count,
+        "gas_result": gas_result,
+    }
+
+
 def validate_transforms():
     """Check all raw files have corresponding processed parquet files."""
     
@@ -84,63 +141,62 @@ def validate_transforms():
     errors = []
     gas_issues = []
     
-    for raw_file in sorted(raw_files):
-        # Expected processed file name
-        processed_name = raw_file.stem + "_processed.parquet"
-        processed_file = PROCESSED_DIR / processed_name
+    raw_files = sorted(raw_files)
+    
+    # Each file pair is checked independently (line count + gas scan over the
+    # raw JSONL) → fan out across processes.
+    # executor.map() yields results in input order, so output stays sorted.
+    # "spawn": workers run Polars (scan_ndjson), so don't fork its thread pool.
+    with ProcessPoolExecutor(mp_context=multiprocessing.get_context("spawn")) as executor:
+        results = executor.map(check_transformed_file, raw_files)
+    
+    for raw_file, result in zip(raw_files, results):
+        processed_name = result["processed_name"]
         
-        if not processed_file.exists():
+        if result["status"] == "missing":
             missing.append(raw_file.name)
             print(f"✗ MISSING: {processed_name}")
             continue
         
-        try:
-            # Try loading parquet to verify it's valid
-            df = pl.read_parquet(processed_file)
-            
-            # Count raw lines (each line = 1 log entry)
-            with open(raw_file, 'r') as f:
-                raw_count = sum(1 for _ in f)
-            
-            processed_count = len(df)
-            
-            # Validate gas fields
-            gas_result = validate_gas_fields(raw_file)
-            
-            # Check if counts match
-            count_match = raw_count == processed_count
-            gas_valid = gas_result["valid"]
-            
-            if count_match and gas_valid:
-                status = "✓"
-            elif not gas_valid:
-                status = "⚠"
-            else:
-                status = "⚠"
-            
-            print(f"{status} {raw_file.name}")
-            print(f"   Raw: {raw_count:,} → Processed: {processed_count:,}")
-            
-            # Report gas field issues
-            if not gas_valid:
-                gas_issues.append({
-                    "file": raw_file.name,
-                    **gas_result
-                })
-                print(f"   ⚠ Gas Fields: {gas_result['missing_gasPrice']} missing gasPrice, {gas_result['missing_gasUsed']} missing gasUsed")
-            else:
-                print(f"   ✓ Gas Fields: All {gas_result['total_logs']} logs have gasPrice and gasUsed")
-            
-            valid.append({
+        if result["status"] == "error":
+            errors.append((raw_file.name, result["error"]))
+            print(f"✗ ERROR reading {processed_name}: {result['error']}")
+            continue
+        
+        raw_count = result["raw_count"]
+        processed_count = result["processed_count"]
+        gas_result = result["gas_result"]
+        
+        # Check if counts match
+        count_match = raw_count == processed_count
+        gas_valid = gas_result["valid"]
+        
+        if count_match and gas_valid:
+            status = "✓"
+        elif not gas_valid:
+            status = "⚠"
+        else:
+            status = "⚠"
+        
+        print(f"{status} {raw_file.name}")
+        print(f"   Raw: {raw_count:,} → Processed: {processed_count:,}")
+        
+        # Report gas field issues
+        if not gas_valid:
+            gas_issues.append({
                 "file": raw_file.name,
-                "raw": raw_count,
-                "processed": processed_count,
-                "gas_valid": gas_valid
+                **gas_result
             })
-            
-        except Exception as e:
-            errors.append((raw_file.name, str(e)))
-            print(f"✗ ERROR reading {processed_name}: {e}")
+            print(f"   ⚠ Gas Fields: {gas_result['missing_gasPrice']} missing gasPrice, {gas_result['missing_gasUsed']} missing gasUsed")
+        else:
+            print(f"   ✓ Gas Fields: All {gas_result['total_logs']} logs have gasPrice and gasUsed")
+        
+        valid.append({
+            "file": raw_file.name,
+            "raw": raw_count,
+            "processed": processed_count,
+            "gas_valid": gas_valid
+        })
     
     # Summary
     print("-" * 70)
@@ -0,0 +1,72 @@
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import polars as pl
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src" / "etl" / "load"))
+from validate_before_database_load import validate
+
+
+ADDRESS = "0x" + "ab" * 20
+TX_HASH = "0x" + "cd" * 32
+
+
+def processed_frame() -> pl.DataFrame:
+    """One valid processed log row with every column validate() looks at."""
+    address_cols = [
+        "topic_relayer", "filled_relay_data_input_token", "filled_relay_data_output_token",
+        "filled_relay_data_exclusive_relayer", "filled_relay_data_depositor", "filled_relay_data_recipient",
+        "topic_depositor", "funds_deposited_data_input_token", "funds_deposited_data_output_token",
+        "funds_deposited_data_recipient", "l2_token_address",
+    ]
+    amount_cols = [
+        "filled_relay_data_input_amount", "filled_relay_data_output_amount",
+        "funds_deposited_data_input_amount", "funds_deposited_data_output_amount", "amount_to_return",
+    ]
+    return pl.DataFrame({
+        "timestamp_datetime": [datetime(2026, 1, 5, 12, 0)],
+        "transactionHash": [TX_HASH],
+        "topic_0": ["0x" + "00" * 32],
+        "gas_price_wei": [1_000_000_000.0],
+        "gas_used": [21_000.0],
+        "topic_origin_chain_id": [1],
+        "topic_deposit_id": [7],
+        "filled_relay_data_repayment_chain_id": [10.0],
+        "topic_destination_chain_id": [10],
+        "topic_chain_id": [1],
+        "refund_amounts": ["100,200"],
+        "refund_addresses": [f"{ADDRESS},{ADDRESS}"],
+        "refund_count": [2],
+        **{col: [ADDRESS] for col in address_cols},
+        **{col: [1.5] for col in amount_cols},
+    })
+
+
+def write_parquet(tmp_path: Path, df: pl.DataFrame) -> Path:
+    path = tmp_path / "logs_ethereum_2026-01-05_to_2026-01-06_processed.parquet"
+    df.write_parquet(path)
+    return path
+
+
+def test_valid_file(tmp_path):
+    is_valid, error, min_date, max_date, row_count = validate(write_parquet(tmp_path, processed_frame()))
+    assert (is_valid, error, row_count) == (True, None, 1)
+    assert min_date == max_date == datetime(2026, 1, 5, 12, 0)
+
+
+def test_missing_gas_price_column_reports_earlier_failures_first(tmp_path):
+    df = processed_frame().drop("gas_price_wei").with_columns(pl.lit("0x12").alias("topic_relayer"))
+    result = validate(write_parquet(tmp_path, df))
+    assert result[:2] == (False, "topic_relayer contains invalid addresses (must be 0x... and 42 chars)")
+
+
+def test_missing_gas_price_column_fails_at_gas_check(tmp_path):
+    is_valid, error, *_ = validate(write_parquet(tmp_path, processed_frame().drop("gas_price_wei")))
+    assert not is_valid
+    assert "gas_price_wei" in error
+
+
+def test_string_timestamp_reports_dtype(tmp_path):
+    df = processed_frame().with_columns(pl.col("timestamp_datetime").cast(pl.Utf8))
+    assert validate(write_parquet(tmp_path, df))[:2] == (False, "timestamp_datetime is not a datetime")
@@ -0,0 +1,46 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src" / "etl" / "extract"))
+from validate_extracted_data import validate_prices_csv
+
+
+HEADER = "token_symbol,timestamp,price_usd\n"
+ROW = "ETH,2026-01-05 00:00:00+00:00,3456.78\n"
+
+
+def write_csv(tmp_path: Path, content: str) -> Path:
+    path = tmp_path / "alchemy_prices.csv"
+    path.write_text(content, encoding="utf-8")
+    return path
+
+
+def test_valid_file(tmp_path):
+    is_valid, error, count, metadata = validate_prices_csv(write_csv(tmp_path, HEADER + ROW + ROW.replace("ETH", "BTC")))
+    assert (is_valid, error, count) == (True, None, 2)
+    assert sorted(metadata["tokens"]) == ["BTC", "ETH"]
+
+
+def test_delimiter_only_row_is_an_empty_token(tmp_path):
+    result = validate_prices_csv(write_csv(tmp_path, HEADER + ROW + ",,\n"))
+    assert result[:2] == (False, "Row 3: Empty token_symbol")
+
+
+def test_bom_file_is_rejected(tmp_path):
+    result = validate_prices_csv(write_csv(tmp_path, "﻿" + HEADER + ROW))
+    assert result[:2] == (False, "Missing required columns: ['token_symbol']")
+
+
+def test_missing_price_field(tmp_path):
+    result = validate_prices_csv(write_csv(tmp_path, HEADER + "ETH,2026-01-05 00:00:00+00:00\n"))
+    assert result[:2] == (False, "Row 2: Invalid price_usd: None")
+
+
+def test_empty_price_field(tmp_path):
+    result = validate_prices_csv(write_csv(tmp_path, HEADER + "ETH,2026-01-05 00:00:00+00:00,\n"))
+    assert result[:2] == (False, "Row 2: Invalid price_usd: ")
+
+
+def test_blank_lines_are_skipped(tmp_path):
+    result = validate_prices_csv(write_csv(tmp_path, HEADER + ROW + "\n" + ROW + "\n"))
+    assert result[:3] == (True, None, 2)